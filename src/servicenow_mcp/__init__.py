@@ -7,6 +7,19 @@ focusing on the ITSM module.
 
 __version__ = "0.1.0"
 
-from servicenow_mcp.server import ServiceNowMCP
+__all__ = ["ServiceNowMCP"]
 
-__all__ = ["ServiceNowMCP"] 
\ No newline at end of file
+
+def __getattr__(name):
+    """
+    Import the server on first access.
+
+    The server pulls in FastMCP, so it is only imported when it is used rather
+    than whenever a tool or utility module of this package is imported.
+    """
+    if name != "ServiceNowMCP":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from servicenow_mcp.server import ServiceNowMCP
+
+    globals()[name] = ServiceNowMCP
+    return ServiceNowMCP
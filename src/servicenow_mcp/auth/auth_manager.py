@@ -4,16 +4,21 @@ Authentication manager for the ServiceNow MCP server.
 
 import base64
 import logging
+import threading
+import time
 from typing import Dict, Optional
 
 import requests
-from requests.auth import HTTPBasicAuth
 
 from servicenow_mcp.utils.config import AuthConfig, AuthType
+from servicenow_mcp.utils.http import get_session
 
 
 logger = logging.getLogger(__name__)
 
+# Fetch a new OAuth token this many seconds before the current one expires
+TOKEN_REFRESH_MARGIN = 30
+
 
 class AuthManager:
     """
@@ -33,11 +38,43 @@ class AuthManager:
         self.config = config
         self.token: Optional[str] = None
         self.token_type: Optional[str] = None
+        self.token_expires_at: Optional[float] = None
+        self._headers: Optional[Dict[str, str]] = None
+        # Tools run in worker threads; only one of them rebuilds the headers
+        # or fetches a token at a time
+        self._lock = threading.Lock()
     
     def get_headers(self) -> Dict[str, str]:
         """
         Get the authentication headers for API requests.
         
+        The headers are built once and reused until the OAuth token (if any)
+        is about to expire.
+        
+        Returns:
+            Dict[str, str]: Headers to include in API requests. Callers may
+            modify the returned dictionary.
+        """
+        headers = self._headers
+        if headers is None or self._token_expiring():
+            with self._lock:
+                # Another thread may have rebuilt them while this one waited
+                if self._headers is None or self._token_expiring():
+                    self._headers = self._build_headers()
+                headers = self._headers
+        return dict(headers)
+    
+    def _token_expiring(self) -> bool:
+        """Check whether the OAuth token expires within TOKEN_REFRESH_MARGIN seconds."""
+        return (
+            self.token_expires_at is not None
+            and time.monotonic() >= self.token_expires_at - TOKEN_REFRESH_MARGIN
+        )
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """
+        Build the authentication headers, fetching an OAuth token if needed.
+        
         Returns:
             Dict[str, str]: Headers to include in API requests.
         """
@@ -55,7 +92,7 @@ class AuthManager:
             headers["Authorization"] = f"Basic {encoded}"
         
         elif self.config.type == AuthType.OAUTH:
-            if not self.token:
+            if not self.token or self._token_expiring():
                 self._get_oauth_token()
             
             headers["Authorization"] = f"{self.token_type} {self.token}"
@@ -101,12 +138,17 @@ class AuthManager:
         }
         
         try:
-            response = requests.post(token_url, data=data)
+            response = get_session().post(token_url, data=data)
             response.raise_for_status()
             
             token_data = response.json()
             self.token = token_data.get("access_token")
             self.token_type = token_data.get("token_type", "Bearer")
+            try:
+                self.token_expires_at = time.monotonic() + float(token_data.get("expires_in"))
+            except (TypeError, ValueError):
+                # Without a usable lifetime the token is kept until refresh_token
+                self.token_expires_at = None
             
             if not self.token:
                 raise ValueError("No access token in response")
@@ -118,4 +160,6 @@ class AuthManager:
     def refresh_token(self):
         """Refresh the OAuth token if using OAuth authentication."""
         if self.config.type == AuthType.OAUTH:
-            self._get_oauth_token() 
\ No newline at end of file
+            with self._lock:
+                self._get_oauth_token()
+                self._headers = None 
\ No newline at end of file
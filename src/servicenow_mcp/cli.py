@@ -6,11 +6,10 @@ import argparse
 import logging
 import os
 import sys
-from typing import Dict, Optional
 
 from dotenv import load_dotenv
 
-from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.server import ServiceNowMCP, configure_logging, parse_tool_groups
 from servicenow_mcp.utils.config import (
     ApiKeyConfig,
     AuthConfig,
@@ -21,17 +20,23 @@ from servicenow_mcp.utils.config import (
 )
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def parse_args():
-    """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(description="ServiceNow MCP Server")
+def create_parser(description: str = "ServiceNow MCP Server") -> argparse.ArgumentParser:
+    """
+    Create the parser for the server's command-line arguments.
+
+    Every option defaults to its environment variable, so the parsed
+    arguments can be passed to create_config as they are.
+
+    Args:
+        description: Description shown in the help text.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser.
+    """
+    parser = argparse.ArgumentParser(description=description)
     
     # Server configuration
     parser.add_argument(
@@ -51,6 +56,28 @@ def parse_args():
         help="Request timeout in seconds",
         default=int(os.environ.get("SERVICENOW_TIMEOUT", "30")),
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        help="Seconds to cache results of read-only tools (0 disables caching)",
+        default=int(os.environ.get("SERVICENOW_CACHE_TTL", "60")),
+    )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="Set up the HTTP session and authentication before serving the first request",
+        default=os.environ.get("SERVICENOW_MCP_PREWARM", "false").lower() in ("1", "true"),
+    )
+    parser.add_argument(
+        "--schema-cache-dir",
+        help="Directory for caching tool schemas between starts (e.g., ~/.cache/servicenow-mcp)",
+        default=os.environ.get("SERVICENOW_MCP_SCHEMA_CACHE"),
+    )
+    parser.add_argument(
+        "--tools",
+        help="Comma-separated tool groups to enable (e.g., incident,catalog); all by default",
+        default=os.environ.get("SERVICENOW_MCP_TOOLS"),
+    )
     
     # Authentication
     auth_group = parser.add_argument_group("Authentication")
@@ -105,7 +132,12 @@ def parse_args():
         default=os.environ.get("SERVICENOW_API_KEY_HEADER", "X-ServiceNow-API-Key"),
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    return create_parser().parse_args()
 
 
 def create_config(args) -> ServerConfig:
@@ -166,6 +198,10 @@ def create_config(args) -> ServerConfig:
         auth=auth_config,
         debug=args.debug,
         timeout=args.timeout,
+        cache_ttl=args.cache_ttl,
+        prewarm=args.prewarm,
+        schema_cache_dir=args.schema_cache_dir,
+        enabled_tool_groups=parse_tool_groups(args.tools),
     )
 
 
@@ -177,6 +213,7 @@ def main():
     try:
         # Parse command-line arguments
         args = parse_args()
+        configure_logging(args.debug)
         
         # Create server configuration
         config = create_config(args)
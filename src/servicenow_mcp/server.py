@@ -4,310 +4,608 @@ ServiceNow MCP Server
 This module provides the main implementation of the ServiceNow MCP server.
 """
 
-import json
+import importlib
+import importlib.util
+import inspect
 import logging
 import os
-from typing import Any, Dict, Union
+import threading
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
+import anyio
+import anyio.to_thread
 from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.types import Tool as MCPTool
+from pydantic import BaseModel
 
 from servicenow_mcp.auth.auth_manager import AuthManager
-from servicenow_mcp.tools.catalog_optimization import (
-    OptimizationRecommendationsParams,
-    UpdateCatalogItemParams,
-)
-from servicenow_mcp.tools.catalog_optimization import (
-    get_optimization_recommendations as get_optimization_recommendations_tool,
-)
-from servicenow_mcp.tools.catalog_optimization import (
-    update_catalog_item as update_catalog_item_tool,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    CreateCatalogCategoryParams,
-    GetCatalogItemParams,
-    ListCatalogCategoriesParams,
-    ListCatalogItemsParams,
-    MoveCatalogItemsParams,
-    UpdateCatalogCategoryParams,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    create_catalog_category as create_catalog_category_tool,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    get_catalog_item as get_catalog_item_tool,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    list_catalog_categories as list_catalog_categories_tool,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    list_catalog_items as list_catalog_items_tool,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    move_catalog_items as move_catalog_items_tool,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    update_catalog_category as update_catalog_category_tool,
-)
-from servicenow_mcp.tools.catalog_variables import (
-    CreateCatalogItemVariableParams,
-    ListCatalogItemVariablesParams,
-    UpdateCatalogItemVariableParams,
-)
-from servicenow_mcp.tools.catalog_variables import (
-    create_catalog_item_variable as create_catalog_item_variable_tool,
-)
-from servicenow_mcp.tools.catalog_variables import (
-    list_catalog_item_variables as list_catalog_item_variables_tool,
-)
-from servicenow_mcp.tools.catalog_variables import (
-    update_catalog_item_variable as update_catalog_item_variable_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    AddChangeTaskParams,
-    ApproveChangeParams,
-    CreateChangeRequestParams,
-    GetChangeRequestDetailsParams,
-    ListChangeRequestsParams,
-    RejectChangeParams,
-    SubmitChangeForApprovalParams,
-    UpdateChangeRequestParams,
-)
-from servicenow_mcp.tools.change_tools import (
-    add_change_task as add_change_task_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    approve_change as approve_change_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    create_change_request as create_change_request_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    get_change_request_details as get_change_request_details_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    list_change_requests as list_change_requests_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    reject_change as reject_change_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    submit_change_for_approval as submit_change_for_approval_tool,
-)
-from servicenow_mcp.tools.change_tools import (
-    update_change_request as update_change_request_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    AddFileToChangesetParams,
-    CommitChangesetParams,
-    CreateChangesetParams,
-    GetChangesetDetailsParams,
-    ListChangesetsParams,
-    PublishChangesetParams,
-    UpdateChangesetParams,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    add_file_to_changeset as add_file_to_changeset_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    commit_changeset as commit_changeset_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    create_changeset as create_changeset_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    get_changeset_details as get_changeset_details_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    list_changesets as list_changesets_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    publish_changeset as publish_changeset_tool,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    update_changeset as update_changeset_tool,
-)
-from servicenow_mcp.tools.incident_tools import (
-    AddCommentParams,
-    CreateIncidentParams,
-    ListIncidentsParams,
-    ResolveIncidentParams,
-    UpdateIncidentParams,
-)
-from servicenow_mcp.tools.incident_tools import (
-    add_comment as add_comment_tool,
-)
-from servicenow_mcp.tools.incident_tools import (
-    create_incident as create_incident_tool,
-)
-from servicenow_mcp.tools.incident_tools import (
-    list_incidents as list_incidents_tool,
-)
-from servicenow_mcp.tools.incident_tools import (
-    resolve_incident as resolve_incident_tool,
-)
-from servicenow_mcp.tools.incident_tools import (
-    update_incident as update_incident_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    ArticleResponse,
-    CategoryResponse,
-    CreateArticleParams,
-    CreateCategoryParams,
-    CreateKnowledgeBaseParams,
-    GetArticleParams,
-    KnowledgeBaseResponse,
-    ListArticlesParams,
-    ListCategoriesParams,
-    ListKnowledgeBasesParams,
-    PublishArticleParams,
-    UpdateArticleParams,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    create_article as create_article_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    create_category as create_category_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    create_knowledge_base as create_knowledge_base_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    get_article as get_article_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    list_articles as list_articles_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    list_categories as list_categories_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    list_knowledge_bases as list_knowledge_bases_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    publish_article as publish_article_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    update_article as update_article_tool,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    CreateScriptIncludeParams,
-    DeleteScriptIncludeParams,
-    GetScriptIncludeParams,
-    ListScriptIncludesParams,
-    ScriptIncludeResponse,
-    UpdateScriptIncludeParams,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    create_script_include as create_script_include_tool,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    delete_script_include as delete_script_include_tool,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    get_script_include as get_script_include_tool,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    list_script_includes as list_script_includes_tool,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    update_script_include as update_script_include_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    AddGroupMembersParams,
-    CreateGroupParams,
-    CreateUserParams,
-    GetUserParams,
-    ListGroupsParams,
-    ListUsersParams,
-    RemoveGroupMembersParams,
-    UpdateGroupParams,
-    UpdateUserParams,
-)
-from servicenow_mcp.tools.user_tools import (
-    add_group_members as add_group_members_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    create_group as create_group_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    create_user as create_user_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    get_user as get_user_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    list_groups as list_groups_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    list_users as list_users_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    remove_group_members as remove_group_members_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    update_group as update_group_tool,
-)
-from servicenow_mcp.tools.user_tools import (
-    update_user as update_user_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    ActivateWorkflowParams,
-    AddWorkflowActivityParams,
-    CreateWorkflowParams,
-    DeactivateWorkflowParams,
-    DeleteWorkflowActivityParams,
-    GetWorkflowActivitiesParams,
-    GetWorkflowDetailsParams,
-    ListWorkflowsParams,
-    ListWorkflowVersionsParams,
-    ReorderWorkflowActivitiesParams,
-    UpdateWorkflowActivityParams,
-    UpdateWorkflowParams,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    activate_workflow as activate_workflow_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    add_workflow_activity as add_workflow_activity_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    create_workflow as create_workflow_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    deactivate_workflow as deactivate_workflow_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    delete_workflow_activity as delete_workflow_activity_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    get_workflow_activities as get_workflow_activities_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    get_workflow_details as get_workflow_details_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    list_workflow_versions as list_workflow_versions_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    list_workflows as list_workflows_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    reorder_workflow_activities as reorder_workflow_activities_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    update_workflow as update_workflow_tool,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    update_workflow_activity as update_workflow_activity_tool,
-)
+from servicenow_mcp.utils import serialization
+from servicenow_mcp.utils.cache import TTLCache
 from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.http import close_session, get_session
+from servicenow_mcp.utils.schema_cache import SchemaCache, schema_key
+
+
+class _ToolSpec(NamedTuple):
+    """How a tool function is exposed as an MCP tool."""
+
+    module: str  # Module under servicenow_mcp.tools that defines the tool
+    name: str  # Name of the tool function, also used as the MCP tool name
+    params: str  # Name of the tool's params model in the same module
+    description: str
+    as_json: bool = False  # Return the result serialized as a JSON string
+
+
+# Tools by group, in the order they are registered. A group's tool modules are
+# only imported when the group is registered; ServerConfig.enabled_tool_groups
+# (or SERVICENOW_MCP_TOOLS) restricts registration to a subset of the groups.
+_TOOL_GROUPS: Dict[str, Tuple[_ToolSpec, ...]] = {
+    "incident": (
+        _ToolSpec(
+            "incident_tools",
+            "create_incident",
+            "CreateIncidentParams",
+            "Create a new incident in ServiceNow",
+        ),
+        _ToolSpec(
+            "incident_tools",
+            "update_incident",
+            "UpdateIncidentParams",
+            "Update an existing incident in ServiceNow",
+        ),
+        _ToolSpec(
+            "incident_tools",
+            "add_comment",
+            "AddCommentParams",
+            "Add a comment to an incident in ServiceNow",
+        ),
+        _ToolSpec(
+            "incident_tools",
+            "resolve_incident",
+            "ResolveIncidentParams",
+            "Resolve an incident in ServiceNow",
+        ),
+        _ToolSpec(
+            "incident_tools",
+            "list_incidents",
+            "ListIncidentsParams",
+            "List incidents from ServiceNow",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "incident_tools",
+            "get_incidents",
+            "GetIncidentsParams",
+            "Get several incidents from ServiceNow in a single request",
+            as_json=True,
+        ),
+    ),
+    "catalog": (
+        _ToolSpec(
+            "catalog_tools",
+            "list_catalog_items",
+            "ListCatalogItemsParams",
+            "List service catalog items.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_tools",
+            "get_catalog_item",
+            "GetCatalogItemParams",
+            "Get a specific service catalog item.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_tools",
+            "list_catalog_categories",
+            "ListCatalogCategoriesParams",
+            "List service catalog categories.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_tools",
+            "create_catalog_category",
+            "CreateCatalogCategoryParams",
+            "Create a new service catalog category.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_tools",
+            "update_catalog_category",
+            "UpdateCatalogCategoryParams",
+            "Update an existing service catalog category.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_tools",
+            "move_catalog_items",
+            "MoveCatalogItemsParams",
+            "Move catalog items to a different category.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_optimization",
+            "get_optimization_recommendations",
+            "OptimizationRecommendationsParams",
+            "Get optimization recommendations for the service catalog.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_optimization",
+            "update_catalog_item",
+            "UpdateCatalogItemParams",
+            "Update a service catalog item.",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "catalog_variables",
+            "create_catalog_item_variable",
+            "CreateCatalogItemVariableParams",
+            "Create a new catalog item variable",
+        ),
+        _ToolSpec(
+            "catalog_variables",
+            "list_catalog_item_variables",
+            "ListCatalogItemVariablesParams",
+            "List catalog item variables",
+        ),
+        _ToolSpec(
+            "catalog_variables",
+            "update_catalog_item_variable",
+            "UpdateCatalogItemVariableParams",
+            "Update a catalog item variable",
+        ),
+    ),
+    "change": (
+        _ToolSpec(
+            "change_tools",
+            "create_change_request",
+            "CreateChangeRequestParams",
+            "Create a new change request in ServiceNow",
+        ),
+        _ToolSpec(
+            "change_tools",
+            "update_change_request",
+            "UpdateChangeRequestParams",
+            "Update an existing change request in ServiceNow",
+        ),
+        _ToolSpec(
+            "change_tools",
+            "list_change_requests",
+            "ListChangeRequestsParams",
+            "List change requests from ServiceNow",
+        ),
+        _ToolSpec(
+            "change_tools",
+            "get_change_request_details",
+            "GetChangeRequestDetailsParams",
+            "Get detailed information about a specific change request",
+        ),
+        _ToolSpec(
+            "change_tools",
+            "add_change_task",
+            "AddChangeTaskParams",
+            "Add a task to a change request",
+        ),
+        _ToolSpec(
+            "change_tools",
+            "submit_change_for_approval",
+            "SubmitChangeForApprovalParams",
+            "Submit a change request for approval",
+        ),
+        _ToolSpec(
+            "change_tools",
+            "approve_change",
+            "ApproveChangeParams",
+            "Approve a change request",
+        ),
+        _ToolSpec("change_tools", "reject_change", "RejectChangeParams", "Reject a change request"),
+    ),
+    "workflow": (
+        _ToolSpec(
+            "workflow_tools",
+            "list_workflows",
+            "ListWorkflowsParams",
+            "List workflows from ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "get_workflow_details",
+            "GetWorkflowDetailsParams",
+            "Get detailed information about a specific workflow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "list_workflow_versions",
+            "ListWorkflowVersionsParams",
+            "List workflow versions from ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "get_workflow_activities",
+            "GetWorkflowActivitiesParams",
+            "Get activities for a specific workflow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "create_workflow",
+            "CreateWorkflowParams",
+            "Create a new workflow in ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "update_workflow",
+            "UpdateWorkflowParams",
+            "Update an existing workflow in ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "activate_workflow",
+            "ActivateWorkflowParams",
+            "Activate a workflow in ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "deactivate_workflow",
+            "DeactivateWorkflowParams",
+            "Deactivate a workflow in ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "add_workflow_activity",
+            "AddWorkflowActivityParams",
+            "Add a new activity to a workflow in ServiceNow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "update_workflow_activity",
+            "UpdateWorkflowActivityParams",
+            "Update an existing activity in a workflow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "delete_workflow_activity",
+            "DeleteWorkflowActivityParams",
+            "Delete an activity from a workflow",
+        ),
+        _ToolSpec(
+            "workflow_tools",
+            "reorder_workflow_activities",
+            "ReorderWorkflowActivitiesParams",
+            "Reorder activities in a workflow",
+        ),
+    ),
+    "changeset": (
+        _ToolSpec(
+            "changeset_tools",
+            "list_changesets",
+            "ListChangesetsParams",
+            "List changesets from ServiceNow",
+        ),
+        _ToolSpec(
+            "changeset_tools",
+            "get_changeset_details",
+            "GetChangesetDetailsParams",
+            "Get detailed information about a specific changeset",
+        ),
+        _ToolSpec(
+            "changeset_tools",
+            "create_changeset",
+            "CreateChangesetParams",
+            "Create a new changeset in ServiceNow",
+        ),
+        _ToolSpec(
+            "changeset_tools",
+            "update_changeset",
+            "UpdateChangesetParams",
+            "Update an existing changeset in ServiceNow",
+        ),
+        _ToolSpec(
+            "changeset_tools",
+            "commit_changeset",
+            "CommitChangesetParams",
+            "Commit a changeset in ServiceNow",
+        ),
+        _ToolSpec(
+            "changeset_tools",
+            "publish_changeset",
+            "PublishChangesetParams",
+            "Publish a changeset in ServiceNow",
+        ),
+        _ToolSpec(
+            "changeset_tools",
+            "add_file_to_changeset",
+            "AddFileToChangesetParams",
+            "Add a file to a changeset in ServiceNow",
+        ),
+    ),
+    "script_include": (
+        _ToolSpec(
+            "script_include_tools",
+            "list_script_includes",
+            "ListScriptIncludesParams",
+            "List script includes from ServiceNow",
+        ),
+        _ToolSpec(
+            "script_include_tools",
+            "get_script_include",
+            "GetScriptIncludeParams",
+            "Get a specific script include from ServiceNow",
+        ),
+        _ToolSpec(
+            "script_include_tools",
+            "create_script_include",
+            "CreateScriptIncludeParams",
+            "Create a new script include in ServiceNow",
+        ),
+        _ToolSpec(
+            "script_include_tools",
+            "update_script_include",
+            "UpdateScriptIncludeParams",
+            "Update an existing script include in ServiceNow",
+        ),
+        _ToolSpec(
+            "script_include_tools",
+            "delete_script_include",
+            "DeleteScriptIncludeParams",
+            "Delete a script include in ServiceNow",
+            as_json=True,
+        ),
+    ),
+    "knowledge_base": (
+        _ToolSpec(
+            "knowledge_base",
+            "create_knowledge_base",
+            "CreateKnowledgeBaseParams",
+            "Create a new knowledge base in ServiceNow",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "list_knowledge_bases",
+            "ListKnowledgeBasesParams",
+            "List knowledge bases from ServiceNow",
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "create_category",
+            "CreateCategoryParams",
+            "Create a new category in a knowledge base",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "create_article",
+            "CreateArticleParams",
+            "Create a new knowledge article",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "update_article",
+            "UpdateArticleParams",
+            "Update an existing knowledge article",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "publish_article",
+            "PublishArticleParams",
+            "Publish a knowledge article",
+            as_json=True,
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "list_articles",
+            "ListArticlesParams",
+            "List knowledge articles",
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "get_article",
+            "GetArticleParams",
+            "Get a specific knowledge article by ID",
+        ),
+        _ToolSpec(
+            "knowledge_base",
+            "list_categories",
+            "ListCategoriesParams",
+            "List categories in a knowledge base",
+        ),
+    ),
+    "user": (
+        _ToolSpec(
+            "user_tools",
+            "create_user",
+            "CreateUserParams",
+            "Create a new user in ServiceNow",
+        ),
+        _ToolSpec(
+            "user_tools",
+            "update_user",
+            "UpdateUserParams",
+            "Update an existing user in ServiceNow",
+        ),
+        _ToolSpec("user_tools", "get_user", "GetUserParams", "Get a specific user in ServiceNow"),
+        _ToolSpec("user_tools", "list_users", "ListUsersParams", "List users in ServiceNow"),
+        _ToolSpec(
+            "user_tools",
+            "create_group",
+            "CreateGroupParams",
+            "Create a new group in ServiceNow",
+        ),
+        _ToolSpec(
+            "user_tools",
+            "update_group",
+            "UpdateGroupParams",
+            "Update an existing group in ServiceNow",
+        ),
+        _ToolSpec(
+            "user_tools",
+            "add_group_members",
+            "AddGroupMembersParams",
+            "Add members to an existing group in ServiceNow",
+        ),
+        _ToolSpec(
+            "user_tools",
+            "remove_group_members",
+            "RemoveGroupMembersParams",
+            "Remove members from an existing group in ServiceNow",
+        ),
+        _ToolSpec(
+            "user_tools",
+            "list_groups",
+            "ListGroupsParams",
+            "List groups from ServiceNow with optional filtering",
+        ),
+    ),
+}
+
+# Tools whose names start with these prefixes only read data and can be cached
+_READ_ONLY_PREFIXES = ("list_", "get_")
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def configure_logging(debug: bool = False) -> None:
+    """
+    Configure logging unless the application has already done so.
+
+    Only warnings and errors are logged by default; set SERVICENOW_MCP_LOG_LEVEL
+    (e.g. to INFO) or enable debug mode for more output.
+
+    Args:
+        debug: Whether to log at DEBUG level.
+    """
+    if logging.getLogger().handlers:
+        return
+
+    level = "DEBUG" if debug else os.getenv("SERVICENOW_MCP_LOG_LEVEL", "WARNING").upper()
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+# FastMCP tools by name, description and signature, without their function,
+# shared by every server in the process so that each tool's input schema is
+# only generated once
+_TOOL_TEMPLATES: Dict[Tuple[Any, ...], Tool] = {}
+
+
+class _CachingToolManager(ToolManager):
+    """A FastMCP tool manager that reuses tool schemas built by earlier servers."""
+
+    def __init__(self, schema_cache: Optional[SchemaCache] = None, **kwargs):
+        """
+        Initialize the tool manager.
+
+        Args:
+            schema_cache: Schemas saved by earlier starts, or None to always
+                generate schemas that are not cached in this process.
+            **kwargs: Passed on to ToolManager.
+        """
+        super().__init__(**kwargs)
+        self.schema_cache = schema_cache
+        # Response to tools/list, built on first request after a tool is added
+        self._listing: Optional[List[MCPTool]] = None
+
+    def add_tool(
+        self,
+        fn: Callable,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Tool:
+        """Add a tool, copying its metadata from a cached template when possible."""
+        signature = inspect.signature(fn)
+        key = (
+            name,
+            description,
+            inspect.iscoroutinefunction(fn),
+            tuple((param.name, param.annotation) for param in signature.parameters.values()),
+        )
+        template = _TOOL_TEMPLATES.get(key)
+        if template is None:
+            tool = self._build_tool(fn, name, description, signature)
+            # Keep only the metadata; holding on to fn would keep this server,
+            # and its credentials, alive for as long as the process runs
+            _TOOL_TEMPLATES[key] = tool.model_copy(update={"fn": None})
+        else:
+            tool = template.model_copy(update={"fn": fn})
+        existing = self._tools.get(tool.name)
+        if existing:
+            if self.warn_on_duplicate_tools:
+                logger.warning("Tool already exists: %s", tool.name)
+            return existing
+        self._tools[tool.name] = tool
+        self._listing = None
+        return tool
+
+    async def list_mcp_tools(self) -> List[MCPTool]:
+        """
+        List the tools as sent to MCP clients.
+
+        Same as FastMCP.list_tools, but the list is only rebuilt after a tool
+        is added rather than on every request.
+
+        Returns:
+            List[MCPTool]: The registered tools.
+        """
+        if self._listing is None:
+            self._listing = [
+                MCPTool(name=tool.name, description=tool.description, inputSchema=tool.parameters)
+                for tool in self.list_tools()
+            ]
+        return self._listing
+
+    def _build_tool(
+        self,
+        fn: Callable,
+        name: Optional[str],
+        description: Optional[str],
+        signature: inspect.Signature,
+    ) -> Tool:
+        """Build a tool, taking its input schema from the schema cache if it is there."""
+        annotations = [param.annotation for param in signature.parameters.values()]
+        if self.schema_cache is None or Context in annotations:
+            return Tool.from_function(fn, name=name, description=description)
+
+        cache_key = schema_key(name or fn.__name__, description, annotations)
+        parameters = self.schema_cache.get(cache_key)
+        if parameters is None:
+            tool = Tool.from_function(fn, name=name, description=description)
+            self.schema_cache.set(cache_key, tool.parameters)
+            return tool
+
+        # Same as Tool.from_function, minus the JSON schema generation
+        return Tool(
+            fn=fn,
+            name=name or fn.__name__,
+            description=description or fn.__doc__ or "",
+            parameters=parameters,
+            fn_metadata=func_metadata(fn),
+            is_async=inspect.iscoroutinefunction(fn),
+            context_kwarg=None,
+        )
+
+
+def _backend_options() -> Dict[str, Any]:
+    """Get the anyio backend options for running the server's event loop."""
+    return {"use_uvloop": importlib.util.find_spec("uvloop") is not None}
+
+
+def _is_failure(result: Any) -> bool:
+    """Check whether a tool result reports an unsuccessful call."""
+    if isinstance(result, dict):
+        return result.get("success") is False
+    return getattr(result, "success", None) is False
+
+
 class ServiceNowMCP:
     """
     ServiceNow MCP Server implementation.
@@ -316,6 +614,16 @@ class ServiceNowMCP:
     allowing LLMs to interact with ServiceNow data and functionality.
     """
 
+    __slots__ = (
+        "config",
+        "auth_manager",
+        "_response_cache",
+        "_inflight",
+        "_inflight_lock",
+        "mcp_server",
+        "name",
+    )
+
     def __init__(self, config: Union[Dict, ServerConfig]):
         """
         Initialize the ServiceNow MCP server.
@@ -329,463 +637,169 @@ class ServiceNowMCP:
             self.config = config
 
         self.auth_manager = AuthManager(self.config.auth)
+        # Recent results of read-only tools, keyed by tool group, tool and params
+        self._response_cache = (
+            TTLCache(self.config.cache_ttl) if self.config.cache_ttl > 0 else None
+        )
+        # Read-only tool calls still running, by the same key as the cache
+        self._inflight: Dict[Tuple[str, str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
         self.mcp_server = FastMCP("ServiceNow")
+        # FastMCP has no public hook for supplying tool schemas, so swap in a
+        # tool manager that reuses the ones generated by earlier instances
+        schema_cache = (
+            SchemaCache(self.config.schema_cache_dir) if self.config.schema_cache_dir else None
+        )
+        tool_manager = _CachingToolManager(schema_cache)
+        self.mcp_server._tool_manager = tool_manager
+        self.mcp_server._mcp_server.list_tools()(tool_manager.list_mcp_tools)
         # Add name attribute for MCP CLI
         self.name = "ServiceNow"
 
         # Register resources and tools
         self._register_tools()
-
+        if schema_cache is not None:
+            schema_cache.save()
 
     def _register_tools(self):
-        """Register all ServiceNow tools with the MCP server."""
-
-        # Register incident tools
-        @self.mcp_server.tool()
-        def create_incident(params: CreateIncidentParams) -> str:
-            """Create a new incident in ServiceNow"""
-            return create_incident_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def update_incident(params: UpdateIncidentParams) -> str:
-            """Update an existing incident in ServiceNow"""
-            return update_incident_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def add_comment(params: AddCommentParams) -> str:
-            """Add a comment to an incident in ServiceNow"""
-            return add_comment_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def resolve_incident(params: ResolveIncidentParams) -> str:
-            """Resolve an incident in ServiceNow"""
-            return resolve_incident_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def list_incidents(params: ListIncidentsParams) -> str:
-            """List incidents from ServiceNow"""
-            return list_incidents_tool(self.config, self.auth_manager, params)
-
-        # Register catalog tools
-        @self.mcp_server.tool()
-        def list_catalog_items(params: ListCatalogItemsParams) -> str:
-            """List service catalog items."""
-            return json.dumps(list_catalog_items_tool(self.config, self.auth_manager, params))
-
-        @self.mcp_server.tool()
-        def get_catalog_item(params: GetCatalogItemParams) -> str:
-            """Get a specific service catalog item."""
-            return json.dumps(get_catalog_item_tool(self.config, self.auth_manager, params).dict())
-
-        @self.mcp_server.tool()
-        def list_catalog_categories(params: ListCatalogCategoriesParams) -> str:
-            """List service catalog categories."""
-            return json.dumps(list_catalog_categories_tool(self.config, self.auth_manager, params))
-
-        @self.mcp_server.tool()
-        def create_catalog_category(params: CreateCatalogCategoryParams) -> str:
-            """Create a new service catalog category."""
-            return json.dumps(
-                create_catalog_category_tool(self.config, self.auth_manager, params).dict()
-            )
-
-        @self.mcp_server.tool()
-        def update_catalog_category(params: UpdateCatalogCategoryParams) -> str:
-            """Update an existing service catalog category."""
-            return json.dumps(
-                update_catalog_category_tool(self.config, self.auth_manager, params).dict()
-            )
-
-        @self.mcp_server.tool()
-        def move_catalog_items(params: MoveCatalogItemsParams) -> str:
-            """Move catalog items to a different category."""
-            return json.dumps(
-                move_catalog_items_tool(self.config, self.auth_manager, params).dict()
-            )
-
-        @self.mcp_server.tool()
-        def get_optimization_recommendations(params: OptimizationRecommendationsParams) -> str:
-            """Get optimization recommendations for the service catalog."""
-            return json.dumps(
-                get_optimization_recommendations_tool(self.config, self.auth_manager, params)
-            )
-
-        @self.mcp_server.tool()
-        def update_catalog_item(params: UpdateCatalogItemParams) -> str:
-            """Update a service catalog item."""
-            return json.dumps(
-                update_catalog_item_tool(
-                    self.config,
-                    self.auth_manager,
-                    params,
+        """Register the enabled ServiceNow tool groups with the MCP server."""
+        enabled = self.config.enabled_tool_groups
+        if enabled is not None:
+            unknown = set(enabled) - set(_TOOL_GROUPS)
+            if unknown:
+                logger.warning("Ignoring unknown tool groups: %s", ", ".join(sorted(unknown)))
+
+        for group, specs in _TOOL_GROUPS.items():
+            if enabled is None or group in enabled:
+                for spec in specs:
+                    self._register_tool(group, spec)
+
+    def _register_tool(self, group: str, spec: _ToolSpec):
+        """
+        Register a single tool with the MCP server.
+
+        Args:
+            group: The tool group the tool belongs to.
+            spec: The tool to register.
+        """
+        module = importlib.import_module(f"servicenow_mcp.tools.{spec.module}")
+        tool = getattr(module, spec.name)
+
+        # Everything the call path needs is bound once here, so that a call
+        # only reads fast locals instead of spec and instance attributes
+        call = partial(self._call_tool, group, tool)
+        post = serialization.dumps if spec.as_json else None
+
+        # Exceptions are not caught here: FastMCP reports them to the client
+        # as an error result of the tool call
+        def run(params, _call=call, _post=post):
+            result = _call(params)
+            return _post(result) if _post else result
+
+        # Tool functions make blocking HTTP requests, so they run in a worker
+        # thread to keep the event loop free for other requests
+        async def wrapper(params):
+            return await anyio.to_thread.run_sync(run, params)
+
+        # FastMCP builds the tool's input schema from the wrapper's signature
+        wrapper.__name__ = spec.name
+        wrapper.__doc__ = spec.description
+        wrapper.__signature__ = inspect.Signature(
+            [
+                inspect.Parameter(
+                    "params",
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    annotation=getattr(module, spec.params),
                 )
-            )
-
-        @self.mcp_server.tool()
-        def create_catalog_item_variable(params: CreateCatalogItemVariableParams) -> Dict[str, Any]:
-            """Create a new catalog item variable"""
-            return create_catalog_item_variable_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            ).__dict__
-
-        @self.mcp_server.tool()
-        def list_catalog_item_variables(params: ListCatalogItemVariablesParams) -> Dict[str, Any]:
-            """List catalog item variables"""
-            return list_catalog_item_variables_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            ).__dict__
-
-        @self.mcp_server.tool()
-        def update_catalog_item_variable(params: UpdateCatalogItemVariableParams) -> Dict[str, Any]:
-            """Update a catalog item variable"""
-            return update_catalog_item_variable_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            ).__dict__
-
-        # Register change management tools
-        @self.mcp_server.tool()
-        def create_change_request(params: CreateChangeRequestParams) -> str:
-            """Create a new change request in ServiceNow"""
-            return create_change_request_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def update_change_request(params: UpdateChangeRequestParams) -> str:
-            """Update an existing change request in ServiceNow"""
-            return update_change_request_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def list_change_requests(params: ListChangeRequestsParams) -> str:
-            """List change requests from ServiceNow"""
-            return list_change_requests_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def get_change_request_details(params: GetChangeRequestDetailsParams) -> str:
-            """Get detailed information about a specific change request"""
-            return get_change_request_details_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def add_change_task(params: AddChangeTaskParams) -> str:
-            """Add a task to a change request"""
-            return add_change_task_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def submit_change_for_approval(params: SubmitChangeForApprovalParams) -> str:
-            """Submit a change request for approval"""
-            return submit_change_for_approval_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def approve_change(params: ApproveChangeParams) -> str:
-            """Approve a change request"""
-            return approve_change_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def reject_change(params: RejectChangeParams) -> str:
-            """Reject a change request"""
-            return reject_change_tool(self.config, self.auth_manager, params)
-
-        # Register workflow management tools
-        @self.mcp_server.tool()
-        def list_workflows(params: ListWorkflowsParams) -> str:
-            """List workflows from ServiceNow"""
-            return list_workflows_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def get_workflow_details(params: GetWorkflowDetailsParams) -> str:
-            """Get detailed information about a specific workflow"""
-            return get_workflow_details_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def list_workflow_versions(params: ListWorkflowVersionsParams) -> str:
-            """List workflow versions from ServiceNow"""
-            return list_workflow_versions_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def get_workflow_activities(params: GetWorkflowActivitiesParams) -> str:
-            """Get activities for a specific workflow"""
-            return get_workflow_activities_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def create_workflow(params: CreateWorkflowParams) -> str:
-            """Create a new workflow in ServiceNow"""
-            return create_workflow_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def update_workflow(params: UpdateWorkflowParams) -> str:
-            """Update an existing workflow in ServiceNow"""
-            return update_workflow_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def activate_workflow(params: ActivateWorkflowParams) -> str:
-            """Activate a workflow in ServiceNow"""
-            return activate_workflow_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def deactivate_workflow(params: DeactivateWorkflowParams) -> str:
-            """Deactivate a workflow in ServiceNow"""
-            return deactivate_workflow_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def add_workflow_activity(params: AddWorkflowActivityParams) -> str:
-            """Add a new activity to a workflow in ServiceNow"""
-            return add_workflow_activity_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def update_workflow_activity(params: UpdateWorkflowActivityParams) -> str:
-            """Update an existing activity in a workflow"""
-            return update_workflow_activity_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def delete_workflow_activity(params: DeleteWorkflowActivityParams) -> str:
-            """Delete an activity from a workflow"""
-            return delete_workflow_activity_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def reorder_workflow_activities(params: ReorderWorkflowActivitiesParams) -> str:
-            """Reorder activities in a workflow"""
-            return reorder_workflow_activities_tool(self.config, self.auth_manager, params)
-
-        # Register changeset management tools
-        @self.mcp_server.tool()
-        def list_changesets(params: ListChangesetsParams) -> str:
-            """List changesets from ServiceNow"""
-            return list_changesets_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def get_changeset_details(params: GetChangesetDetailsParams) -> str:
-            """Get detailed information about a specific changeset"""
-            return get_changeset_details_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def create_changeset(params: CreateChangesetParams) -> str:
-            """Create a new changeset in ServiceNow"""
-            return create_changeset_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def update_changeset(params: UpdateChangesetParams) -> str:
-            """Update an existing changeset in ServiceNow"""
-            return update_changeset_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def commit_changeset(params: CommitChangesetParams) -> str:
-            """Commit a changeset in ServiceNow"""
-            return commit_changeset_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def publish_changeset(params: PublishChangesetParams) -> str:
-            """Publish a changeset in ServiceNow"""
-            return publish_changeset_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def add_file_to_changeset(params: AddFileToChangesetParams) -> str:
-            """Add a file to a changeset in ServiceNow"""
-            return add_file_to_changeset_tool(self.config, self.auth_manager, params)
-
-        # Register script include tools
-        @self.mcp_server.tool()
-        def list_script_includes(params: ListScriptIncludesParams) -> Dict[str, Any]:
-            """List script includes from ServiceNow"""
-            return list_script_includes_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def get_script_include(params: GetScriptIncludeParams) -> Dict[str, Any]:
-            """Get a specific script include from ServiceNow"""
-            return get_script_include_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def create_script_include(params: CreateScriptIncludeParams) -> ScriptIncludeResponse:
-            """Create a new script include in ServiceNow"""
-            return create_script_include_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def update_script_include(params: UpdateScriptIncludeParams) -> ScriptIncludeResponse:
-            """Update an existing script include in ServiceNow"""
-            return update_script_include_tool(self.config, self.auth_manager, params)
-
-        @self.mcp_server.tool()
-        def delete_script_include(params: DeleteScriptIncludeParams) -> str:
-            """Delete a script include in ServiceNow"""
-            return json.dumps(
-                delete_script_include_tool(self.config, self.auth_manager, params).dict()
-            )
-
-        # Knowledge Base tools
-        @self.mcp_server.tool()
-        def create_knowledge_base(params: CreateKnowledgeBaseParams) -> str:
-            """Create a new knowledge base in ServiceNow"""
-            return json.dumps(
-                create_knowledge_base_tool(self.config, self.auth_manager, params).dict()
-            )
-
-        @self.mcp_server.tool()
-        def list_knowledge_bases(params: ListKnowledgeBasesParams) -> Dict[str, Any]:
-            """List knowledge bases from ServiceNow"""
-            logger.info("list_knowledge_bases called with params: %s", params)
-            try:
-                result = list_knowledge_bases_tool(self.config, self.auth_manager, params)
-                logger.info("list_knowledge_bases_tool returned: %s", result)
-
-                # Third approach - match script_include tools exactly by returning raw dictionary
-                logger.info("Using approach: Return raw dictionary (matching script_include tools)")
-                return result
-            except Exception as e:
-                logger.error("Error in list_knowledge_bases: %s", str(e), exc_info=True)
-                return {"success": False, "message": f"Error: {str(e)}"}
-
-        @self.mcp_server.tool()
-        def create_category(params: CreateCategoryParams) -> str:
-            """Create a new category in a knowledge base"""
-            return json.dumps(create_category_tool(self.config, self.auth_manager, params).dict())
-
-        @self.mcp_server.tool()
-        def create_article(params: CreateArticleParams) -> str:
-            """Create a new knowledge article"""
-            return json.dumps(create_article_tool(self.config, self.auth_manager, params).dict())
-
-        @self.mcp_server.tool()
-        def update_article(params: UpdateArticleParams) -> str:
-            """Update an existing knowledge article"""
-            return json.dumps(update_article_tool(self.config, self.auth_manager, params).dict())
-
-        @self.mcp_server.tool()
-        def publish_article(params: PublishArticleParams) -> str:
-            """Publish a knowledge article"""
-            return json.dumps(publish_article_tool(self.config, self.auth_manager, params).dict())
-
-        @self.mcp_server.tool()
-        def list_articles(params: ListArticlesParams) -> Dict[str, Any]:
-            """List knowledge articles"""
-            logger.info("list_articles called with params: %s", params)
-            try:
-                result = list_articles_tool(self.config, self.auth_manager, params)
-                logger.info("list_articles_tool returned type: %s", type(result))
-                return result
-            except Exception as e:
-                logger.error("Error in list_articles: %s", str(e), exc_info=True)
-                return {"success": False, "message": f"Error: {str(e)}"}
-
-        @self.mcp_server.tool()
-        def get_article(params: GetArticleParams) -> Dict[str, Any]:
-            """Get a specific knowledge article by ID"""
-            logger.info("get_article called with params: %s", params)
-            try:
-                result = get_article_tool(self.config, self.auth_manager, params)
-                logger.info("get_article_tool returned type: %s", type(result))
-                return result
-            except Exception as e:
-                logger.error("Error in get_article: %s", str(e), exc_info=True)
-                return {"success": False, "message": f"Error: {str(e)}"}
-
-        @self.mcp_server.tool()
-        def list_categories(params: ListCategoriesParams) -> Dict[str, Any]:
-            """List categories in a knowledge base"""
-            logger.info("list_categories called with params: %s", params)
-            try:
-                result = list_categories_tool(self.config, self.auth_manager, params)
-                logger.info("list_categories_tool returned type: %s", type(result))
+            ]
+        )
+        self.mcp_server.tool(name=spec.name, description=spec.description)(wrapper)
+
+    def _call_tool(self, group: str, tool: Callable, params: BaseModel) -> Any:
+        """
+        Call a tool function, caching and coalescing calls to read-only tools.
+
+        list_* and get_* tools are served from the response cache when they were
+        called with the same parameters within the cache TTL. Identical calls
+        made while one is still running wait for its result instead of sending
+        another request to ServiceNow. Any other tool may change data, so it
+        drops the cached results of its group.
+
+        Args:
+            group: The tool group the tool belongs to.
+            tool: The tool function.
+            params: The validated tool parameters.
+
+        Returns:
+            Any: The tool result.
+        """
+        if not tool.__name__.startswith(_READ_ONLY_PREFIXES):
+            result = tool(self.config, self.auth_manager, params)
+            if self._response_cache is not None:
+                self._response_cache.invalidate(group)
+            return result
+
+        key = (group, tool.__name__, params.model_dump_json())
+        if self._response_cache is not None:
+            found, result = self._response_cache.get(key)
+            if found:
                 return result
-            except Exception as e:
-                logger.error("Error in list_categories: %s", str(e), exc_info=True)
-                return {"success": False, "message": f"Error: {str(e)}"}
-
-        # User management tools
-        @self.mcp_server.tool()
-        def create_user(params: CreateUserParams) -> Dict[str, Any]:
-            """Create a new user in ServiceNow"""
-            return create_user_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def update_user(params: UpdateUserParams) -> Dict[str, Any]:
-            """Update an existing user in ServiceNow"""
-            return update_user_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def get_user(params: GetUserParams) -> Dict[str, Any]:
-            """Get a specific user in ServiceNow"""
-            return get_user_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def list_users(params: ListUsersParams) -> Dict[str, Any]:
-            """List users in ServiceNow"""
-            return list_users_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def create_group(params: CreateGroupParams) -> Dict[str, Any]:
-            """Create a new group in ServiceNow"""
-            return create_group_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def update_group(params: UpdateGroupParams) -> Dict[str, Any]:
-            """Update an existing group in ServiceNow"""
-            return update_group_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def add_group_members(params: AddGroupMembersParams) -> Dict[str, Any]:
-            """Add members to an existing group in ServiceNow"""
-            return add_group_members_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def remove_group_members(params: RemoveGroupMembersParams) -> Dict[str, Any]:
-            """Remove members from an existing group in ServiceNow"""
-            return remove_group_members_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
-
-        @self.mcp_server.tool()
-        def list_groups(params: ListGroupsParams) -> Dict[str, Any]:
-            """List groups from ServiceNow with optional filtering"""
-            return list_groups_tool(
-                self.config,
-                self.auth_manager,
-                params,
-            )
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = tool(self.config, self.auth_manager, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            # Failed calls are not cached so that they are retried
+            if self._response_cache is not None and not _is_failure(result):
+                self._response_cache.set(key, result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def start(self):
         """Start the MCP server."""
-        self.mcp_server.run()
+        configure_logging(self.config.debug)
+        if self.config.prewarm:
+            self.prewarm()
+        # Same as FastMCP.run() for stdio, but on uvloop when it is installed
+        anyio.run(self.mcp_server.run_stdio_async, backend_options=_backend_options())
+
+    def prewarm(self):
+        """
+        Do the one-time setup of the first tool call before serving requests.
+
+        Creates the pooled HTTP session and, for OAuth, fetches the access token,
+        so that the first tool call does not pay for them.
+        """
+        get_session()
+        try:
+            self.auth_manager.get_headers()
+        except ValueError as e:
+            logger.warning("Could not prepare authentication headers: %s", e)
 
     def stop(self):
         """Stop the MCP server."""
-        # Cleanup resources if needed
-        pass
+        close_session()
 
 
-def create_servicenow_mcp(instance_url: str, username: str, password: str):
+def create_servicenow_mcp(
+    instance_url: str,
+    username: str,
+    password: str,
+    enabled_tool_groups: Optional[List[str]] = None,
+):
     """
     Create a ServiceNow MCP server with minimal configuration.
 
@@ -796,6 +810,7 @@ def create_servicenow_mcp(instance_url: str, username: str, password: str):
         instance_url: ServiceNow instance URL
         username: ServiceNow username
         password: ServiceNow password
+        enabled_tool_groups: Tool groups to register, or None to register all of them
 
     Returns:
         A configured ServiceNowMCP instance ready to use
@@ -822,34 +837,81 @@ def create_servicenow_mcp(instance_url: str, username: str, password: str):
     )
 
     # Create server config
-    config = ServerConfig(instance_url=instance_url, auth=auth_config)
+    config = ServerConfig(
+        instance_url=instance_url,
+        auth=auth_config,
+        enabled_tool_groups=enabled_tool_groups,
+    )
 
     # Create and return server
     return ServiceNowMCP(config)
 
 
-# Create a standard variable that MCP CLI can recognize
-# This will be used when running `mcp install src/servicenow_mcp/server.py`
-# The actual configuration will be loaded from environment variables
+def parse_tool_groups(value: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated list of tool groups.
+
+    Args:
+        value: Comma-separated tool group names, e.g. "incident,catalog"
+
+    Returns:
+        The list of group names, or None (all groups) when value is empty
+    """
+    if not value:
+        return None
+    return [group.strip() for group in value.split(",") if group.strip()]
+
+
+# The standard `server` variable that MCP CLI looks for (used when running
+# `mcp install src/servicenow_mcp/server.py`) is built on first access, so that
+# importing this module does not read .env or construct a server
+_server = None
 
-# Load environment variables
-load_dotenv()
 
-# Get configuration from environment variables
-instance_url = os.getenv("SERVICENOW_INSTANCE_URL")
-username = os.getenv("SERVICENOW_USERNAME")
-password = os.getenv("SERVICENOW_PASSWORD")
+def _create_server_from_env() -> ServiceNowMCP:
+    """
+    Create a ServiceNow MCP server from environment variables.
+
+    Returns:
+        A ServiceNowMCP instance configured from the environment, or a dummy
+        instance with default values when the environment is not configured.
+    """
+    # Load environment variables
+    load_dotenv()
+
+    # Get configuration from environment variables
+    instance_url = os.getenv("SERVICENOW_INSTANCE_URL")
+    username = os.getenv("SERVICENOW_USERNAME")
+    password = os.getenv("SERVICENOW_PASSWORD")
+    enabled_tool_groups = parse_tool_groups(os.getenv("SERVICENOW_MCP_TOOLS"))
+
+    if instance_url and username and password:
+        return create_servicenow_mcp(
+            instance_url=instance_url,
+            username=username,
+            password=password,
+            enabled_tool_groups=enabled_tool_groups,
+        )
 
-# Create the server instance with a standard variable name
-# This is the variable that MCP CLI will look for
-if instance_url and username and password:
-    server = create_servicenow_mcp(instance_url=instance_url, username=username, password=password)
-else:
     # Create a dummy server with default values for MCP CLI to discover
     # The actual configuration will be loaded from environment variables when run
-    server = ServiceNowMCP(
-        {
-            "instance_url": "https://example.service-now.com",
-            "auth": {"type": "basic", "basic": {"username": "admin", "password": "password"}},
-        }
+    return ServiceNowMCP(
+        ServerConfig(
+            instance_url="https://example.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC,
+                basic=BasicAuthConfig(username="admin", password="password"),
+            ),
+            enabled_tool_groups=enabled_tool_groups,
+        )
     )
+
+
+def __getattr__(name):
+    """Build the module level ``server`` instance on first access."""
+    global _server
+    if name == "server":
+        if _server is None:
+            _server = _create_server_from_env()
+        return _server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
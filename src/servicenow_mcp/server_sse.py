@@ -4,26 +4,99 @@ ServiceNow MCP Server
 This module provides the main implementation of the ServiceNow MCP server.
 """
 
-import argparse
-import os
-from typing import Dict, Union
-
 import uvicorn
 from dotenv import load_dotenv
 from mcp.server import Server
-from mcp.server.fastmcp import FastMCP
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.requests import Request
+from starlette.responses import Response
 from starlette.routing import Mount, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from servicenow_mcp.cli import create_config, create_parser
+from servicenow_mcp.server import ServiceNowMCP, configure_logging
+from servicenow_mcp.utils import serialization
+
+
+def _replay(body: bytes) -> Receive:
+    """Create an ASGI receive callable that returns an already read request body."""
+    sent = False
+
+    async def receive() -> Message:
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
 
-from servicenow_mcp.server import ServiceNowMCP
-from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+    return receive
+
+
+def accept_batches(handle_post_message: ASGIApp) -> ASGIApp:
+    """
+    Let the SSE message endpoint accept JSON-RPC batches.
+
+    The MCP SSE transport only accepts one JSON-RPC message per POST. This
+    wraps its message handler so that a client can also post an array of
+    messages in one request. Each message is passed on to the transport, and
+    the server handles them concurrently. Responses are sent over the SSE
+    stream as usual and matched to requests by their id.
+
+    Args:
+        handle_post_message: The transport's message handler.
+
+    Returns:
+        ASGIApp: The wrapped message handler.
+    """
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        try:
+            payload = serialization.loads(body)
+        except ValueError:
+            payload = None
+
+        if not isinstance(payload, list):
+            await handle_post_message(scope, _replay(body), send)
+            return
+
+        if not payload:
+            await Response("Empty batch", status_code=400)(scope, receive, send)
+            return
+
+        status_code = 202
+        for item in payload:
+            statuses = []
+
+            async def capture(message: Message, statuses: list = statuses) -> None:
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            await handle_post_message(scope, _replay(serialization.dumps(item).encode()), capture)
+            if status_code == 202 and statuses and statuses[0] != 202:
+                status_code = statuses[0]
+
+        content = (
+            "Accepted" if status_code == 202 else "Could not accept every message in the batch"
+        )
+        await Response(content, status_code=status_code)(scope, _replay(b""), send)
+
+    return app
 
 
 def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
     """Create a Starlette application that can serve the provided mcp server with SSE."""
     sse = SseServerTransport("/messages/")
+    # The options only depend on the registered handlers, so build them once
+    # rather than for every connection
+    initialization_options = mcp_server.create_initialization_options()
 
     async def handle_sse(request: Request) -> None:
         async with sse.connect_sse(
@@ -31,112 +104,55 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
             request.receive,
             request._send,  # noqa: SLF001
         ) as (read_stream, write_stream):
-            await mcp_server.run(
-                read_stream,
-                write_stream,
-                mcp_server.create_initialization_options(),
-            )
+            await mcp_server.run(read_stream, write_stream, initialization_options)
 
     return Starlette(
         debug=debug,
         routes=[
             Route("/sse", endpoint=handle_sse),
-            Mount("/messages/", app=sse.handle_post_message),
+            Mount("/messages/", app=accept_batches(sse.handle_post_message)),
         ],
     )
 
 
-class ServiceNowMCP(ServiceNowMCP):
-    """
-    ServiceNow MCP Server implementation.
-
-    This class provides a Model Context Protocol (MCP) server for ServiceNow,
-    allowing LLMs to interact with ServiceNow data and functionality.
-    """
-
-    def __init__(self, config: Union[Dict, ServerConfig]):
-        """
-        Initialize the ServiceNow MCP server.
-
-        Args:
-            config: Server configuration, either as a dictionary or ServerConfig object.
-        """
-        super().__init__(config)
-        self.mcp_server = FastMCP("ServiceNow", port=8080, host="localhost")
-
-    def start(self, host: str = "0.0.0.0", port: int = 8080):
-        """
-        Start the MCP server with SSE transport using Starlette and Uvicorn.
-
-        Args:
-            host: Host address to bind to
-            port: Port to listen on
-        """
-        # Create Starlette app with SSE transport
-        starlette_app = create_starlette_app(self.mcp_server._mcp_server, debug=True)
-
-        # Run using uvicorn
-        uvicorn.run(starlette_app, host=host, port=port)
-
-
-def create_servicenow_mcp(instance_url: str, username: str, password: str):
+def run_sse_server(server: ServiceNowMCP, host: str = "0.0.0.0", port: int = 8080):
     """
-    Create a ServiceNow MCP server with minimal configuration.
-
-    This is a simplified factory function that creates a pre-configured
-    ServiceNow MCP server with basic authentication.
+    Run a ServiceNow MCP server with SSE transport using Starlette and Uvicorn.
 
     Args:
-        instance_url: ServiceNow instance URL
-        username: ServiceNow username
-        password: ServiceNow password
-
-    Returns:
-        A configured ServiceNowMCP instance ready to use
-
-    Example:
-        ```python
-        from servicenow_mcp.server import create_servicenow_mcp
-
-        # Create an MCP server for ServiceNow
-        mcp = create_servicenow_mcp(
-            instance_url="https://instance.service-now.com",
-            username="admin",
-            password="password"
-        )
-
-        # Start the server
-        mcp.start()
-        ```
+        server: The ServiceNow MCP server to serve
+        host: Host address to bind to
+        port: Port to listen on
     """
+    # Create Starlette app with SSE transport
+    starlette_app = create_starlette_app(server.mcp_server._mcp_server, debug=True)
 
-    # Create basic auth config
-    auth_config = AuthConfig(
-        type=AuthType.BASIC, basic=BasicAuthConfig(username=username, password=password)
-    )
-
-    # Create server config
-    config = ServerConfig(instance_url=instance_url, auth=auth_config)
+    # Set up the HTTP session and auth before the first client connects
+    if server.config.prewarm:
+        server.prewarm()
 
-    # Create and return server
-    return ServiceNowMCP(config)
+    # Run using uvicorn
+    uvicorn.run(starlette_app, host=host, port=port)
 
 
 def main():
     load_dotenv()
 
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="Run ServiceNow MCP SSE-based server")
+    # Parse command line arguments; the server options are the same as for
+    # the stdio server, plus where to listen
+    parser = create_parser("Run ServiceNow MCP SSE-based server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
     args = parser.parse_args()
+    configure_logging(args.debug)
 
-    server = create_servicenow_mcp(
-        instance_url=os.getenv("SERVICENOW_INSTANCE_URL"),
-        username=os.getenv("SERVICENOW_USERNAME"),
-        password=os.getenv("SERVICENOW_PASSWORD"),
-    )
-    server.start(host=args.host, port=args.port)
+    # Fail before building the server if the configuration is incomplete
+    try:
+        config = create_config(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    run_sse_server(ServiceNowMCP(config), host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
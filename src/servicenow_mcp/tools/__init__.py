@@ -2,93 +2,79 @@
 Tools module for the ServiceNow MCP server.
 """
 
-# Import tools as they are implemented
-from servicenow_mcp.tools.catalog_optimization import (
-    get_optimization_recommendations,
-    update_catalog_item,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    create_catalog_category,
-    get_catalog_item,
-    list_catalog_categories,
-    list_catalog_items,
-    move_catalog_items,
-    update_catalog_category,
-)
-from servicenow_mcp.tools.catalog_variables import (
-    create_catalog_item_variable,
-    list_catalog_item_variables,
-    update_catalog_item_variable,
-)
-from servicenow_mcp.tools.change_tools import (
-    add_change_task,
-    approve_change,
-    create_change_request,
-    get_change_request_details,
-    list_change_requests,
-    reject_change,
-    submit_change_for_approval,
-    update_change_request,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    add_file_to_changeset,
-    commit_changeset,
-    create_changeset,
-    get_changeset_details,
-    list_changesets,
-    publish_changeset,
-    update_changeset,
-)
-from servicenow_mcp.tools.incident_tools import (
-    add_comment,
-    create_incident,
-    list_incidents,
-    resolve_incident,
-    update_incident,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    create_article,
-    create_category,
-    create_knowledge_base,
-    get_article,
-    list_articles,
-    list_knowledge_bases,
-    publish_article,
-    update_article,
-    list_categories,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    create_script_include,
-    delete_script_include,
-    get_script_include,
-    list_script_includes,
-    update_script_include,
-)
-from servicenow_mcp.tools.user_tools import (
-    create_user,
-    update_user,
-    get_user,
-    list_users,
-    create_group,
-    update_group,
-    add_group_members,
-    remove_group_members,
-    list_groups,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    activate_workflow,
-    add_workflow_activity,
-    create_workflow,
-    deactivate_workflow,
-    delete_workflow_activity,
-    get_workflow_activities,
-    get_workflow_details,
-    list_workflow_versions,
-    list_workflows,
-    reorder_workflow_activities,
-    update_workflow,
-    update_workflow_activity,
-)
+import importlib
+
+# Tool modules are imported on first attribute access (PEP 562) so that
+# importing one tool module does not pull in all of the others
+_LAZY_MAP = {
+    "get_optimization_recommendations": "servicenow_mcp.tools.catalog_optimization",
+    "update_catalog_item": "servicenow_mcp.tools.catalog_optimization",
+    "create_catalog_category": "servicenow_mcp.tools.catalog_tools",
+    "get_catalog_item": "servicenow_mcp.tools.catalog_tools",
+    "list_catalog_categories": "servicenow_mcp.tools.catalog_tools",
+    "list_catalog_items": "servicenow_mcp.tools.catalog_tools",
+    "move_catalog_items": "servicenow_mcp.tools.catalog_tools",
+    "update_catalog_category": "servicenow_mcp.tools.catalog_tools",
+    "create_catalog_item_variable": "servicenow_mcp.tools.catalog_variables",
+    "list_catalog_item_variables": "servicenow_mcp.tools.catalog_variables",
+    "update_catalog_item_variable": "servicenow_mcp.tools.catalog_variables",
+    "add_change_task": "servicenow_mcp.tools.change_tools",
+    "approve_change": "servicenow_mcp.tools.change_tools",
+    "create_change_request": "servicenow_mcp.tools.change_tools",
+    "get_change_request_details": "servicenow_mcp.tools.change_tools",
+    "list_change_requests": "servicenow_mcp.tools.change_tools",
+    "reject_change": "servicenow_mcp.tools.change_tools",
+    "submit_change_for_approval": "servicenow_mcp.tools.change_tools",
+    "update_change_request": "servicenow_mcp.tools.change_tools",
+    "add_file_to_changeset": "servicenow_mcp.tools.changeset_tools",
+    "commit_changeset": "servicenow_mcp.tools.changeset_tools",
+    "create_changeset": "servicenow_mcp.tools.changeset_tools",
+    "get_changeset_details": "servicenow_mcp.tools.changeset_tools",
+    "list_changesets": "servicenow_mcp.tools.changeset_tools",
+    "publish_changeset": "servicenow_mcp.tools.changeset_tools",
+    "update_changeset": "servicenow_mcp.tools.changeset_tools",
+    "add_comment": "servicenow_mcp.tools.incident_tools",
+    "create_incident": "servicenow_mcp.tools.incident_tools",
+    "get_incidents": "servicenow_mcp.tools.incident_tools",
+    "list_incidents": "servicenow_mcp.tools.incident_tools",
+    "resolve_incident": "servicenow_mcp.tools.incident_tools",
+    "update_incident": "servicenow_mcp.tools.incident_tools",
+    "create_article": "servicenow_mcp.tools.knowledge_base",
+    "create_category": "servicenow_mcp.tools.knowledge_base",
+    "create_knowledge_base": "servicenow_mcp.tools.knowledge_base",
+    "get_article": "servicenow_mcp.tools.knowledge_base",
+    "list_articles": "servicenow_mcp.tools.knowledge_base",
+    "list_knowledge_bases": "servicenow_mcp.tools.knowledge_base",
+    "publish_article": "servicenow_mcp.tools.knowledge_base",
+    "update_article": "servicenow_mcp.tools.knowledge_base",
+    "list_categories": "servicenow_mcp.tools.knowledge_base",
+    "create_script_include": "servicenow_mcp.tools.script_include_tools",
+    "delete_script_include": "servicenow_mcp.tools.script_include_tools",
+    "get_script_include": "servicenow_mcp.tools.script_include_tools",
+    "list_script_includes": "servicenow_mcp.tools.script_include_tools",
+    "update_script_include": "servicenow_mcp.tools.script_include_tools",
+    "create_user": "servicenow_mcp.tools.user_tools",
+    "update_user": "servicenow_mcp.tools.user_tools",
+    "get_user": "servicenow_mcp.tools.user_tools",
+    "list_users": "servicenow_mcp.tools.user_tools",
+    "create_group": "servicenow_mcp.tools.user_tools",
+    "update_group": "servicenow_mcp.tools.user_tools",
+    "add_group_members": "servicenow_mcp.tools.user_tools",
+    "remove_group_members": "servicenow_mcp.tools.user_tools",
+    "list_groups": "servicenow_mcp.tools.user_tools",
+    "activate_workflow": "servicenow_mcp.tools.workflow_tools",
+    "add_workflow_activity": "servicenow_mcp.tools.workflow_tools",
+    "create_workflow": "servicenow_mcp.tools.workflow_tools",
+    "deactivate_workflow": "servicenow_mcp.tools.workflow_tools",
+    "delete_workflow_activity": "servicenow_mcp.tools.workflow_tools",
+    "get_workflow_activities": "servicenow_mcp.tools.workflow_tools",
+    "get_workflow_details": "servicenow_mcp.tools.workflow_tools",
+    "list_workflow_versions": "servicenow_mcp.tools.workflow_tools",
+    "list_workflows": "servicenow_mcp.tools.workflow_tools",
+    "reorder_workflow_activities": "servicenow_mcp.tools.workflow_tools",
+    "update_workflow": "servicenow_mcp.tools.workflow_tools",
+    "update_workflow_activity": "servicenow_mcp.tools.workflow_tools",
+}
 
 # from servicenow_mcp.tools.problem_tools import create_problem, update_problem
 # from servicenow_mcp.tools.request_tools import create_request, update_request
@@ -100,6 +86,7 @@ __all__ = [
     "add_comment",
     "resolve_incident",
     "list_incidents",
+    "get_incidents",
     
     # Catalog tools
     "list_catalog_items",
@@ -181,4 +168,13 @@ __all__ = [
     # "update_problem",
     # "create_request",
     # "update_request",
-] 
\ No newline at end of file
+] 
+
+
+def __getattr__(name):
+    """Import the tool module that provides ``name`` on first access."""
+    if name not in _LAZY_MAP:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_MAP[name]), name)
+    globals()[name] = value
+    return value
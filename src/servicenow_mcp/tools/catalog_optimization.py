@@ -11,10 +11,9 @@ import random
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-import requests
-
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -181,7 +180,7 @@ def update_catalog_item(
         headers = auth_manager.get_headers()
         headers["Content-Type"] = "application/json"
         
-        response = requests.patch(url, headers=headers, json=body)
+        response = get_session().patch(url, headers=headers, json=body)
         response.raise_for_status()
         
         return {
@@ -228,7 +227,7 @@ def _get_inactive_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_session().get(url, headers=headers, params=params)
         response.raise_for_status()
         
         return response.json()["result"]
@@ -267,7 +266,7 @@ def _get_low_usage_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_session().get(url, headers=headers, params=params)
         response.raise_for_status()
         
         # In a real implementation, we would query the request table to get actual usage data
@@ -317,7 +316,7 @@ def _get_high_abandonment_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_session().get(url, headers=headers, params=params)
         response.raise_for_status()
         
         # In a real implementation, we would query the request table to get actual abandonment data
@@ -373,7 +372,7 @@ def _get_slow_fulfillment_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_session().get(url, headers=headers, params=params)
         response.raise_for_status()
         
         # In a real implementation, we would query the request table to get actual fulfillment data
@@ -429,7 +428,7 @@ def _get_poor_description_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_session().get(url, headers=headers, params=params)
         response.raise_for_status()
         
         items = response.json()["result"]
@@ -11,10 +11,18 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
+from servicenow_mcp.utils.batch import BatchRequest, submit_batch
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
+# Columns read by list_catalog_items and list_catalog_categories; only these
+# are requested from ServiceNow
+_CATALOG_ITEM_FIELDS = "sys_id,name,short_description,category,price,picture,active,order"
+_CATALOG_CATEGORY_FIELDS = "sys_id,title,description,parent,icon,active,order"
+
 
 class ListCatalogItemsParams(BaseModel):
     """Parameters for listing service catalog items."""
@@ -106,6 +114,7 @@ def list_catalog_items(
         "sysparm_offset": params.offset,
         "sysparm_display_value": "true",
         "sysparm_exclude_reference_link": "true",
+        "sysparm_fields": _CATALOG_ITEM_FIELDS,
     }
     
     # Add filters
@@ -125,11 +134,11 @@ def list_catalog_items(
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_session().get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
-        result = response.json()
+        result = serialization.loads(response.content)
         items = result.get("result", [])
         
         # Format the response
@@ -199,7 +208,7 @@ def get_catalog_item(
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_session().get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
@@ -277,7 +286,7 @@ def get_catalog_item_variables(
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_session().get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
@@ -332,6 +341,7 @@ def list_catalog_categories(
         "sysparm_offset": params.offset,
         "sysparm_display_value": "true",
         "sysparm_exclude_reference_link": "true",
+        "sysparm_fields": _CATALOG_CATEGORY_FIELDS,
     }
     
     # Add filters
@@ -349,11 +359,11 @@ def list_catalog_categories(
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_session().get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
-        result = response.json()
+        result = serialization.loads(response.content)
         categories = result.get("result", [])
         
         # Format the response
@@ -433,7 +443,7 @@ def create_catalog_category(
     headers["Content-Type"] = "application/json"
     
     try:
-        response = requests.post(url, headers=headers, json=body)
+        response = get_session().post(url, headers=headers, json=body)
         response.raise_for_status()
         
         # Process the response
@@ -508,7 +518,7 @@ def update_catalog_category(
     headers["Content-Type"] = "application/json"
     
     try:
-        response = requests.patch(url, headers=headers, json=body)
+        response = get_session().patch(url, headers=headers, json=body)
         response.raise_for_status()
         
         # Process the response
@@ -559,31 +569,32 @@ def move_catalog_items(
     """
     logger.info(f"Moving {len(params.item_ids)} catalog items to category: {params.target_category_id}")
     
-    # Build the API URL
-    url = f"{config.instance_url}/api/now/table/sc_cat_item"
-    
-    # Make the API request for each item
-    headers = auth_manager.get_headers()
-    headers["Accept"] = "application/json"
-    headers["Content-Type"] = "application/json"
+    # Send every item update in a single Batch API call
+    body = {"category": params.target_category_id}
+    batch = [
+        BatchRequest(str(index), "PATCH", f"/api/now/table/sc_cat_item/{item_id}", body)
+        for index, item_id in enumerate(params.item_ids)
+    ]
     
     success_count = 0
     failed_items = []
     
     try:
-        for item_id in params.item_ids:
-            item_url = f"{url}/{item_id}"
-            body = {
-                "category": params.target_category_id
-            }
-            
-            try:
-                response = requests.patch(item_url, headers=headers, json=body)
-                response.raise_for_status()
+        results = {}
+        if batch:
+            results = submit_batch(config, auth_manager, batch)
+        for request, item_id in zip(batch, params.item_ids, strict=True):
+            result = results.get(request.id)
+            if result is not None and 200 <= result.status_code < 300:
                 success_count += 1
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error moving catalog item {item_id}: {str(e)}")
-                failed_items.append({"item_id": item_id, "error": str(e)})
+            else:
+                error = (
+                    f"HTTP {result.status_code}"
+                    if result and result.status_code
+                    else "Request not serviced"
+                )
+                logger.error(f"Error moving catalog item {item_id}: {error}")
+                failed_items.append({"item_id": item_id, "error": error})
         
         # Prepare the response
         if success_count == len(params.item_ids):
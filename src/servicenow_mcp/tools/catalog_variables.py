@@ -11,7 +11,9 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +128,7 @@ def create_catalog_item_variable(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -188,7 +190,7 @@ def list_catalog_item_variables(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -196,7 +198,7 @@ def list_catalog_item_variables(
         )
         response.raise_for_status()
 
-        result = response.json().get("result", [])
+        result = serialization.loads(response.content).get("result", [])
         
         return ListCatalogItemVariablesResponse(
             success=True,
@@ -264,7 +266,7 @@ def update_catalog_item_variable(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_session().patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
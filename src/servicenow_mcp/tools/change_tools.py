@@ -12,7 +12,9 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session, run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +118,13 @@ def _unwrap_and_validate_params(params: Any, model_class: Type[T], required_fiel
     Returns:
         A tuple of (success, result) where result is either the validated parameters or an error message.
     """
+    # The MCP server passes params already validated as the right model
+    if isinstance(params, model_class):
+        return {
+            "success": True,
+            "params": params,
+        }
+    
     # Handle case where params might be wrapped in another dictionary
     if isinstance(params, dict) and len(params) == 1 and "params" in params and isinstance(params["params"], dict):
         logger.warning("Detected params wrapped in a 'params' key. Unwrapping...")
@@ -126,7 +135,7 @@ def _unwrap_and_validate_params(params: Any, model_class: Type[T], required_fiel
         try:
             # Try to convert to dict if it's a Pydantic model
             logger.warning("Params is not a dictionary. Attempting to convert...")
-            params = params.dict() if hasattr(params, "dict") else dict(params)
+            params = params.model_dump() if hasattr(params, "model_dump") else dict(params)
         except Exception as e:
             logger.error(f"Failed to convert params to dictionary: {e}")
             return {
@@ -281,7 +290,7 @@ def create_change_request(
     url = f"{instance_url}/api/now/table/change_request"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_session().post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -375,7 +384,7 @@ def update_change_request(
     url = f"{instance_url}/api/now/table/change_request/{validated_params.change_id}"
     
     try:
-        response = requests.put(url, json=data, headers=headers)
+        response = get_session().put(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -476,10 +485,10 @@ def list_change_requests(
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_session().get(url, headers=headers, params=params)
         response.raise_for_status()
         
-        result = response.json()
+        result = serialization.loads(response.content)
         
         # Handle the case where result["result"] is a list
         change_requests = result.get("result", [])
@@ -550,22 +559,24 @@ def get_change_request_details(
         "sysparm_display_value": "true",
     }
     
+    # Tasks associated with this change request
+    tasks_url = f"{instance_url}/api/now/table/change_task"
+    tasks_params = {
+        "sysparm_query": f"change_request={validated_params.change_id}",
+        "sysparm_display_value": "true",
+    }
+    
     try:
-        response = requests.get(url, headers=headers, params=params)
+        # The change request and its tasks are independent, so fetch both at once
+        session = get_session()
+        response, tasks_response = run_concurrently(
+            lambda: session.get(url, headers=headers, params=params),
+            lambda: session.get(tasks_url, headers=headers, params=tasks_params),
+        )
         response.raise_for_status()
-        
-        result = response.json()
-        
-        # Get tasks associated with this change request
-        tasks_url = f"{instance_url}/api/now/table/change_task"
-        tasks_params = {
-            "sysparm_query": f"change_request={validated_params.change_id}",
-            "sysparm_display_value": "true",
-        }
-        
-        tasks_response = requests.get(tasks_url, headers=headers, params=tasks_params)
         tasks_response.raise_for_status()
         
+        result = response.json()
         tasks_result = tasks_response.json()
         
         return {
@@ -648,7 +659,7 @@ def add_change_task(
     url = f"{instance_url}/api/now/table/change_task"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_session().post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -726,7 +737,7 @@ def submit_change_for_approval(
     url = f"{instance_url}/api/now/table/change_request/{validated_params.change_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_session().patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         # Now, create an approval request
@@ -737,7 +748,7 @@ def submit_change_for_approval(
             "state": "requested",
         }
         
-        approval_response = requests.post(approval_url, json=approval_data, headers=headers)
+        approval_response = get_session().post(approval_url, json=approval_data, headers=headers)
         approval_response.raise_for_status()
         
         approval_result = approval_response.json()
@@ -808,7 +819,9 @@ def approve_change(
     }
     
     try:
-        approval_response = requests.get(approval_query_url, headers=headers, params=query_params)
+        approval_response = get_session().get(
+            approval_query_url, headers=headers, params=query_params
+        )
         approval_response.raise_for_status()
         
         approval_result = approval_response.json()
@@ -832,7 +845,9 @@ def approve_change(
         if validated_params.approval_comments:
             approval_data["comments"] = validated_params.approval_comments
         
-        approval_update_response = requests.patch(approval_update_url, json=approval_data, headers=headers)
+        approval_update_response = get_session().patch(
+            approval_update_url, json=approval_data, headers=headers
+        )
         approval_update_response.raise_for_status()
         
         # Finally, update the change request state to "implement"
@@ -842,7 +857,7 @@ def approve_change(
             "state": "implement",  # This may vary depending on ServiceNow configuration
         }
         
-        change_response = requests.patch(change_url, json=change_data, headers=headers)
+        change_response = get_session().patch(change_url, json=change_data, headers=headers)
         change_response.raise_for_status()
         
         return {
@@ -910,7 +925,9 @@ def reject_change(
     }
     
     try:
-        approval_response = requests.get(approval_query_url, headers=headers, params=query_params)
+        approval_response = get_session().get(
+            approval_query_url, headers=headers, params=query_params
+        )
         approval_response.raise_for_status()
         
         approval_result = approval_response.json()
@@ -932,7 +949,9 @@ def reject_change(
             "comments": validated_params.rejection_reason,
         }
         
-        approval_update_response = requests.patch(approval_update_url, json=approval_data, headers=headers)
+        approval_update_response = get_session().patch(
+            approval_update_url, json=approval_data, headers=headers
+        )
         approval_update_response.raise_for_status()
         
         # Finally, update the change request state to "canceled"
@@ -943,7 +962,7 @@ def reject_change(
             "work_notes": f"Change request rejected: {validated_params.rejection_reason}",
         }
         
-        change_response = requests.patch(change_url, json=change_data, headers=headers)
+        change_response = get_session().patch(change_url, json=change_data, headers=headers)
         change_response.raise_for_status()
         
         return {
@@ -11,7 +11,9 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +104,7 @@ def _unwrap_and_validate_params(
                 model_instance = params
             # Otherwise, convert to dict and create new instance
             else:
-                model_instance = model_class(**params.dict())
+                model_instance = model_class(**params.model_dump())
         # Handle dictionary case
         else:
             # Create model instance
@@ -265,10 +267,10 @@ def list_changesets(
     url = f"{instance_url}/api/now/table/sys_update_set"
     
     try:
-        response = requests.get(url, params=query_params, headers=headers)
+        response = get_session().get(url, params=query_params, headers=headers)
         response.raise_for_status()
         
-        result = response.json()
+        result = serialization.loads(response.content)
         
         return {
             "success": True,
@@ -331,7 +333,7 @@ def get_changeset_details(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -345,7 +347,7 @@ def get_changeset_details(
             "sysparm_query": f"update_set={validated_params.changeset_id}",
         }
         
-        changes_response = requests.get(changes_url, params=changes_params, headers=headers)
+        changes_response = get_session().get(changes_url, params=changes_params, headers=headers)
         changes_response.raise_for_status()
         
         changes_result = changes_response.json()
@@ -428,7 +430,7 @@ def create_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_session().post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -517,7 +519,7 @@ def update_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_session().patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -595,7 +597,7 @@ def commit_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_session().patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -673,7 +675,7 @@ def publish_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_session().patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -750,7 +752,7 @@ def add_file_to_changeset(
     url = f"{instance_url}/api/now/table/sys_update_xml"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_session().post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
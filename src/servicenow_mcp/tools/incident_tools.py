@@ -5,16 +5,21 @@ This module provides tools for managing incidents in ServiceNow.
 """
 
 import logging
-from typing import Optional, List
+import re
+from typing import Any, Optional, List
 
 import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
+# A ServiceNow sys_id is a 32 character lowercase hex string
+_SYSID_RE = re.compile(r"^[0-9a-f]{32}\Z")
+
 
 class CreateIncidentParams(BaseModel):
     """Parameters for creating an incident."""
@@ -77,6 +82,12 @@ class ListIncidentsParams(BaseModel):
     query: Optional[str] = Field(None, description="Search query for incidents")
 
 
+class GetIncidentsParams(BaseModel):
+    """Parameters for fetching several incidents at once."""
+
+    incident_ids: List[str] = Field(..., description="Incident numbers or sys_ids to fetch")
+
+
 class IncidentResponse(BaseModel):
     """Response from incident operations."""
 
@@ -86,6 +97,60 @@ class IncidentResponse(BaseModel):
     incident_number: Optional[str] = Field(None, description="Number of the affected incident")
 
 
+class IncidentRecord(BaseModel):
+    """
+    An incident as returned by list_incidents.
+
+    Values are passed through as ServiceNow returns them, so fields are not
+    restricted to strings.
+    """
+
+    sys_id: Any = Field(None, description="sys_id of the incident")
+    number: Any = Field(None, description="Incident number")
+    short_description: Any = Field(None, description="Short description of the incident")
+    description: Any = Field(None, description="Detailed description of the incident")
+    state: Any = Field(None, description="State of the incident")
+    priority: Any = Field(None, description="Priority of the incident")
+    assigned_to: Any = Field(None, description="User assigned to the incident")
+    category: Any = Field(None, description="Category of the incident")
+    subcategory: Any = Field(None, description="Subcategory of the incident")
+    created_on: Any = Field(
+        None, validation_alias="sys_created_on", description="Creation timestamp"
+    )
+    updated_on: Any = Field(
+        None, validation_alias="sys_updated_on", description="Last update timestamp"
+    )
+
+    @field_validator("assigned_to", mode="before")
+    @classmethod
+    def _unwrap_reference(cls, value: Any) -> Any:
+        """Reference fields may come back as a dict holding the display value."""
+        if isinstance(value, dict):
+            return value.get("display_value")
+        return value
+
+
+class _IncidentListResult(BaseModel):
+    """The body of a ServiceNow table API response for incident rows."""
+
+    result: List[IncidentRecord] = Field(default_factory=list)
+
+
+# Dumps a whole list of IncidentRecord back to dictionaries in one call
+_INCIDENT_LIST_ADAPTER = TypeAdapter(List[IncidentRecord])
+
+# Only the ServiceNow columns that IncidentRecord reads are requested
+_INCIDENT_FIELDS = ",".join(
+    field.validation_alias or name for name, field in IncidentRecord.model_fields.items()
+)
+
+# ListIncidentsParams fields that map to an equality filter on the same column
+_INCIDENT_FILTER_FIELDS = ("state", "assigned_to", "category")
+
+# Text search clause for list_incidents, matched against both descriptions
+_INCIDENT_SEARCH_TEMPLATE = "short_descriptionLIKE{query}^ORdescriptionLIKE{query}".format
+
+
 def create_incident(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -130,7 +195,7 @@ def create_incident(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -173,7 +238,7 @@ def update_incident(
     """
     # Determine if incident_id is a number or sys_id
     incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
+    if _SYSID_RE.match(incident_id):
         # This is likely a sys_id
         api_url = f"{config.api_url}/table/incident/{incident_id}"
     else:
@@ -186,7 +251,7 @@ def update_incident(
                 "sysparm_limit": 1,
             }
 
-            response = requests.get(
+            response = get_session().get(
                 query_url,
                 params=query_params,
                 headers=auth_manager.get_headers(),
@@ -243,7 +308,7 @@ def update_incident(
 
     # Make request
     try:
-        response = requests.put(
+        response = get_session().put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -286,7 +351,7 @@ def add_comment(
     """
     # Determine if incident_id is a number or sys_id
     incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
+    if _SYSID_RE.match(incident_id):
         # This is likely a sys_id
         api_url = f"{config.api_url}/table/incident/{incident_id}"
     else:
@@ -299,7 +364,7 @@ def add_comment(
                 "sysparm_limit": 1,
             }
 
-            response = requests.get(
+            response = get_session().get(
                 query_url,
                 params=query_params,
                 headers=auth_manager.get_headers(),
@@ -334,7 +399,7 @@ def add_comment(
 
     # Make request
     try:
-        response = requests.put(
+        response = get_session().put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -377,7 +442,7 @@ def resolve_incident(
     """
     # Determine if incident_id is a number or sys_id
     incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
+    if _SYSID_RE.match(incident_id):
         # This is likely a sys_id
         api_url = f"{config.api_url}/table/incident/{incident_id}"
     else:
@@ -390,7 +455,7 @@ def resolve_incident(
                 "sysparm_limit": 1,
             }
 
-            response = requests.get(
+            response = get_session().get(
                 query_url,
                 params=query_params,
                 headers=auth_manager.get_headers(),
@@ -425,7 +490,7 @@ def resolve_incident(
 
     # Make request
     try:
-        response = requests.put(
+        response = get_session().put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -450,6 +515,36 @@ def resolve_incident(
         )
 
 
+def _incident_query(
+    state: Optional[str],
+    assigned_to: Optional[str],
+    category: Optional[str],
+    query: Optional[str],
+) -> str:
+    """
+    Build the encoded query for list_incidents.
+
+    Args:
+        state: Filter by incident state.
+        assigned_to: Filter by assigned user.
+        category: Filter by category.
+        query: Search text matched against the descriptions.
+
+    Returns:
+        str: The encoded query, or an empty string when there are no filters.
+    """
+    filters = [
+        f"{field}={value}"
+        for field, value in zip(
+            _INCIDENT_FILTER_FIELDS, (state, assigned_to, category), strict=True
+        )
+        if value
+    ]
+    if query:
+        filters.append(_INCIDENT_SEARCH_TEMPLATE(query=query))
+    return "^".join(filters)
+
+
 def list_incidents(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -474,25 +569,17 @@ def list_incidents(
         "sysparm_offset": params.offset,
         "sysparm_display_value": "true",
         "sysparm_exclude_reference_link": "true",
+        "sysparm_fields": _INCIDENT_FIELDS,
     }
     
     # Add filters
-    filters = []
-    if params.state:
-        filters.append(f"state={params.state}")
-    if params.assigned_to:
-        filters.append(f"assigned_to={params.assigned_to}")
-    if params.category:
-        filters.append(f"category={params.category}")
-    if params.query:
-        filters.append(f"short_descriptionLIKE{params.query}^ORdescriptionLIKE{params.query}")
-    
-    if filters:
-        query_params["sysparm_query"] = "^".join(filters)
+    query = _incident_query(params.state, params.assigned_to, params.category, params.query)
+    if query:
+        query_params["sysparm_query"] = query
     
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -500,29 +587,10 @@ def list_incidents(
         )
         response.raise_for_status()
         
-        data = response.json()
-        incidents = []
-        
-        for incident_data in data.get("result", []):
-            # Handle assigned_to field which could be a string or a dictionary
-            assigned_to = incident_data.get("assigned_to")
-            if isinstance(assigned_to, dict):
-                assigned_to = assigned_to.get("display_value")
-            
-            incident = {
-                "sys_id": incident_data.get("sys_id"),
-                "number": incident_data.get("number"),
-                "short_description": incident_data.get("short_description"),
-                "description": incident_data.get("description"),
-                "state": incident_data.get("state"),
-                "priority": incident_data.get("priority"),
-                "assigned_to": assigned_to,
-                "category": incident_data.get("category"),
-                "subcategory": incident_data.get("subcategory"),
-                "created_on": incident_data.get("sys_created_on"),
-                "updated_on": incident_data.get("sys_updated_on"),
-            }
-            incidents.append(incident)
+        # Validate the raw body in one pass rather than decoding it and then
+        # validating each row separately
+        records = _IncidentListResult.model_validate_json(response.content).result
+        incidents = _INCIDENT_LIST_ADAPTER.dump_python(records)
         
         return {
             "success": True,
@@ -530,10 +598,89 @@ def list_incidents(
             "incidents": incidents
         }
         
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
+        # ValueError covers a body that is not a JSON incident list, which
+        # pydantic reports as a ValidationError
         logger.error(f"Failed to list incidents: {e}")
         return {
             "success": False,
             "message": f"Failed to list incidents: {str(e)}",
             "incidents": []
         }
+
+
+def get_incidents(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetIncidentsParams,
+) -> dict:
+    """
+    Get several incidents from ServiceNow in a single request.
+
+    Numbers and sys_ids may be mixed; they are combined into one IN query
+    instead of issuing a request per incident.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for fetching the incidents.
+
+    Returns:
+        Dictionary with list of incidents.
+    """
+    api_url = f"{config.api_url}/table/incident"
+
+    sys_ids = [incident_id for incident_id in params.incident_ids if _SYSID_RE.match(incident_id)]
+    numbers = [
+        incident_id for incident_id in params.incident_ids if not _SYSID_RE.match(incident_id)
+    ]
+
+    clauses = []
+    if sys_ids:
+        clauses.append(f"sys_idIN{','.join(sys_ids)}")
+    if numbers:
+        clauses.append(f"numberIN{','.join(numbers)}")
+
+    if not clauses:
+        return {
+            "success": True,
+            "message": "Found 0 incidents",
+            "incidents": [],
+        }
+
+    query_params = {
+        "sysparm_query": "^OR".join(clauses),
+        "sysparm_limit": len(params.incident_ids),
+        "sysparm_display_value": "true",
+        "sysparm_exclude_reference_link": "true",
+        "sysparm_fields": _INCIDENT_FIELDS,
+    }
+
+    # Make request
+    try:
+        response = get_session().get(
+            api_url,
+            params=query_params,
+            headers=auth_manager.get_headers(),
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+
+        records = _IncidentListResult.model_validate_json(response.content).result
+        incidents = _INCIDENT_LIST_ADAPTER.dump_python(records)
+
+        return {
+            "success": True,
+            "message": f"Found {len(incidents)} incidents",
+            "incidents": incidents,
+        }
+
+    except (requests.RequestException, ValueError) as e:
+        # ValueError covers a body that is not a JSON incident list, which
+        # pydantic reports as a ValidationError
+        logger.error(f"Failed to get incidents: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to get incidents: {str(e)}",
+            "incidents": [],
+        }
@@ -11,10 +11,22 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
+# Columns read by list_knowledge_bases and list_articles; only these are
+# requested from ServiceNow
+_KNOWLEDGE_BASE_FIELDS = (
+    "sys_id,title,description,owner,kb_managers,active,sys_created_on,sys_updated_on"
+)
+_ARTICLE_LIST_FIELDS = (
+    "sys_id,short_description,kb_knowledge_base,kb_category,workflow_state,"
+    "sys_created_on,sys_updated_on"
+)
+
 
 class CreateKnowledgeBaseParams(BaseModel):
     """Parameters for creating a knowledge base."""
@@ -169,7 +181,7 @@ def create_knowledge_base(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -217,6 +229,7 @@ def list_knowledge_bases(
         "sysparm_limit": params.limit,
         "sysparm_offset": params.offset,
         "sysparm_display_value": "true",
+        "sysparm_fields": _KNOWLEDGE_BASE_FIELDS,
     }
 
     # Build query string
@@ -231,7 +244,7 @@ def list_knowledge_bases(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -240,7 +253,7 @@ def list_knowledge_bases(
         response.raise_for_status()
 
         # Get the JSON response 
-        json_response = response.json()
+        json_response = serialization.loads(response.content)
         
         # Safely extract the result
         if isinstance(json_response, dict) and "result" in json_response:
@@ -357,7 +370,7 @@ def create_category(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -425,7 +438,7 @@ def create_article(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -485,7 +498,7 @@ def update_article(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_session().patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -539,7 +552,7 @@ def publish_article(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_session().patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -588,6 +601,7 @@ def list_articles(
         "sysparm_limit": params.limit,
         "sysparm_offset": params.offset,
         "sysparm_display_value": "all",
+        "sysparm_fields": _ARTICLE_LIST_FIELDS,
     }
 
     # Build query string
@@ -611,7 +625,7 @@ def list_articles(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -620,7 +634,7 @@ def list_articles(
         response.raise_for_status()
 
         # Get the JSON response
-        json_response = response.json()
+        json_response = serialization.loads(response.content)
         logger.debug(f"Article listing raw response: {json_response}")
         
         # Safely extract the result
@@ -725,7 +739,7 @@ def get_article(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -856,7 +870,7 @@ def list_categories(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -865,7 +879,7 @@ def list_categories(
         response.raise_for_status()
 
         # Get the JSON response
-        json_response = response.json()
+        json_response = serialization.loads(response.content)
         
         # Safely extract the result
         if isinstance(json_response, dict) and "result" in json_response:
@@ -7,11 +7,12 @@ This module provides tools for managing script includes in ServiceNow.
 import logging
 from typing import Any, Dict, Optional
 
-import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +97,10 @@ def list_script_includes(
             "sysparm_offset": params.offset,
             "sysparm_display_value": "true",
             "sysparm_exclude_reference_link": "true",
-            "sysparm_fields": "sys_id,name,script,description,api_name,client_callable,active,access,sys_created_on,sys_updated_on,sys_created_by,sys_updated_by"
+            "sysparm_fields": (
+                "sys_id,name,description,api_name,client_callable,active,access,"
+                "sys_created_on,sys_updated_on,sys_created_by,sys_updated_by"
+            ),
         }
         
         # Add filters if provided
@@ -117,7 +121,7 @@ def list_script_includes(
         # Make the request
         headers = auth_manager.get_headers()
         
-        response = requests.get(
+        response = get_session().get(
             url,
             params=query_params,
             headers=headers,
@@ -126,7 +130,7 @@ def list_script_includes(
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
+        data = serialization.loads(response.content)
         script_includes = []
         
         for item in data.get("result", []):
@@ -201,7 +205,7 @@ def get_script_include(
         # Make the request
         headers = auth_manager.get_headers()
         
-        response = requests.get(
+        response = get_session().get(
             url,
             params=query_params,
             headers=headers,
@@ -210,7 +214,7 @@ def get_script_include(
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
+        data = serialization.loads(response.content)
         
         if "result" not in data:
             return {
@@ -296,7 +300,7 @@ def create_script_include(
     headers = auth_manager.get_headers()
     
     try:
-        response = requests.post(
+        response = get_session().post(
             url,
             json=body,
             headers=headers,
@@ -395,7 +399,7 @@ def update_script_include(
     headers = auth_manager.get_headers()
     
     try:
-        response = requests.patch(
+        response = get_session().patch(
             url,
             json=body,
             headers=headers,
@@ -465,7 +469,7 @@ def delete_script_include(
     headers = auth_manager.get_headers()
     
     try:
-        response = requests.delete(
+        response = get_session().delete(
             url,
             headers=headers,
             timeout=30,
@@ -11,7 +11,10 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
+from servicenow_mcp.utils.batch import BatchRequest, submit_batch
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -195,7 +198,7 @@ def create_user(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -271,7 +274,7 @@ def update_user(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_session().patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -334,7 +337,7 @@ def get_user(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -392,7 +395,7 @@ def list_users(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -400,7 +403,7 @@ def list_users(
         )
         response.raise_for_status()
 
-        result = response.json().get("result", [])
+        result = serialization.loads(response.content).get("result", [])
 
         return {
             "success": True,
@@ -451,7 +454,7 @@ def list_groups(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -459,7 +462,7 @@ def list_groups(
         )
         response.raise_for_status()
 
-        result = response.json().get("result", [])
+        result = serialization.loads(response.content).get("result", [])
 
         return {
             "success": True,
@@ -514,7 +517,7 @@ def assign_roles_to_user(
         }
 
         try:
-            response = requests.post(
+            response = get_session().post(
                 api_url,
                 json=data,
                 headers=auth_manager.get_headers(),
@@ -551,7 +554,7 @@ def get_role_id(
     }
 
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -595,7 +598,7 @@ def check_user_has_role(
     }
 
     try:
-        response = requests.get(
+        response = get_session().get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -648,7 +651,7 @@ def create_group(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_session().post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -719,7 +722,7 @@ def update_group(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_session().patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -760,10 +763,10 @@ def add_group_members(
     Returns:
         Response with the result of the operation.
     """
-    api_url = f"{config.api_url}/table/sys_user_grmember"
-
     success = True
     failed_members = []
+    batch = []
+    batch_members = []
 
     for member in params.members:
         # Get user ID if username is provided
@@ -780,24 +783,29 @@ def add_group_members(
                 failed_members.append(member)
                 continue
 
-        # Create group membership
+        # Queue the group membership; all of them are created in one batch call
         data = {
             "group": params.group_id,
             "user": user_id,
         }
+        batch.append(
+            BatchRequest(str(len(batch)), "POST", "/api/now/table/sys_user_grmember", data)
+        )
+        batch_members.append(member)
 
+    if batch:
         try:
-            response = requests.post(
-                api_url,
-                json=data,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
+            results = submit_batch(config, auth_manager, batch)
         except requests.RequestException as e:
-            logger.error(f"Failed to add member '{member}' to group: {e}")
-            success = False
-            failed_members.append(member)
+            logger.error(f"Failed to add members to group: {e}")
+            results = {}
+
+        for request, member in zip(batch, batch_members, strict=True):
+            result = results.get(request.id)
+            if result is None or not 200 <= result.status_code < 300:
+                logger.error(f"Failed to add member '{member}' to group")
+                success = False
+                failed_members.append(member)
 
     if failed_members:
         message = f"Some members could not be added to the group: {', '.join(failed_members)}"
@@ -854,7 +862,7 @@ def remove_group_members(
 
         try:
             # First find the membership record
-            response = requests.get(
+            response = get_session().get(
                 api_url,
                 params=query_params,
                 headers=auth_manager.get_headers(),
@@ -872,7 +880,7 @@ def remove_group_members(
             membership_id = result[0].get("sys_id")
             delete_url = f"{api_url}/{membership_id}"
 
-            response = requests.delete(
+            response = get_session().delete(
                 delete_url,
                 headers=auth_manager.get_headers(),
                 timeout=config.timeout,
@@ -5,14 +5,15 @@ This module provides tools for viewing and managing workflows in ServiceNow.
 """
 
 import logging
-from datetime import datetime
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -131,7 +132,7 @@ def _unwrap_params(params: Any, param_class: Type[T]) -> Dict[str, Any]:
     if isinstance(params, dict):
         return params
     if isinstance(params, param_class):
-        return params.dict(exclude_none=True)
+        return params.model_dump(exclude_none=True)
     return params
 
 
@@ -231,10 +232,10 @@ def list_workflows(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow"
         
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_session().get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
-        result = response.json()
+        result = serialization.loads(response.content)
         return {
             "workflows": result.get("result", []),
             "count": len(result.get("result", [])),
@@ -282,7 +283,7 @@ def get_workflow_details(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -339,10 +340,10 @@ def list_workflow_versions(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow_version"
         
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_session().get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
-        result = response.json()
+        result = serialization.loads(response.content)
         return {
             "versions": result.get("result", []),
             "count": len(result.get("result", [])),
@@ -398,9 +399,13 @@ def get_workflow_activities(
                 "sysparm_query": f"workflow={workflow_id}^published=true",
                 "sysparm_limit": 1,
                 "sysparm_orderby": "version DESC",
+                # Only the version's sys_id is needed to look up its activities
+                "sysparm_fields": "sys_id",
             }
             
-            version_response = requests.get(version_url, headers=headers, params=version_params)
+            version_response = get_session().get(
+                version_url, headers=headers, params=version_params
+            )
             version_response.raise_for_status()
             
             version_result = version_response.json()
@@ -429,7 +434,9 @@ def get_workflow_activities(
             "sysparm_orderby": "order",
         }
         
-        activities_response = requests.get(activities_url, headers=headers, params=activities_params)
+        activities_response = get_session().get(
+            activities_url, headers=headers, params=activities_params
+        )
         activities_response.raise_for_status()
         
         activities_result = activities_response.json()
@@ -500,7 +507,7 @@ def create_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow"
         
-        response = requests.post(url, headers=headers, json=data)
+        response = get_session().post(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -573,7 +580,7 @@ def update_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_session().patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -629,7 +636,7 @@ def activate_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_session().patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -685,7 +692,7 @@ def deactivate_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_session().patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -757,7 +764,7 @@ def add_workflow_activity(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_activity"
         
-        response = requests.post(url, headers=headers, json=data)
+        response = get_session().post(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -824,7 +831,7 @@ def update_workflow_activity(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_activity/{activity_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_session().patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -875,7 +882,7 @@ def delete_workflow_activity(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_activity/{activity_id}"
         
-        response = requests.delete(url, headers=headers)
+        response = get_session().delete(url, headers=headers)
         response.raise_for_status()
         
         return {
@@ -937,7 +944,7 @@ def reorder_workflow_activities(
             data = {"order": new_order}
             
             try:
-                response = requests.patch(url, headers=headers, json=data)
+                response = get_session().patch(url, headers=headers, json=data)
                 response.raise_for_status()
                 
                 results.append({
@@ -998,7 +1005,7 @@ def delete_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.delete(url, headers=headers)
+        response = get_session().delete(url, headers=headers)
         response.raise_for_status()
         
         return {
@@ -0,0 +1,99 @@
+"""
+ServiceNow Batch API client for the ServiceNow MCP server.
+
+Tools that change many records at once send their requests through the
+``/api/now/v1/batch`` endpoint, so that N record updates cost one HTTP round
+trip instead of N.
+"""
+
+import base64
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils import serialization
+from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http import get_session
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = [
+    {"name": "Content-Type", "value": "application/json"},
+    {"name": "Accept", "value": "application/json"},
+]
+
+
+class BatchRequest(NamedTuple):
+    """A single REST request sent as part of a batch."""
+
+    id: str
+    method: str
+    url: str
+    body: Optional[Dict[str, Any]] = None
+
+
+class BatchResult(NamedTuple):
+    """The outcome of a single request in a batch."""
+
+    status_code: int
+    body: Any
+
+
+def submit_batch(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    sub_requests: List[BatchRequest],
+) -> Dict[str, BatchResult]:
+    """
+    Send several REST requests to ServiceNow in one Batch API call.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        sub_requests: The requests to send. URLs are relative to the instance,
+            e.g. ``/api/now/table/incident/<sys_id>``.
+
+    Returns:
+        Dict[str, BatchResult]: The result of each request, keyed by request id.
+        Requests that ServiceNow did not service are reported with status code 0.
+
+    Raises:
+        requests.RequestException: If the batch call itself fails, or its
+            response is not JSON.
+    """
+    rest_requests = []
+    for request in sub_requests:
+        rest_request = {
+            "id": request.id,
+            "method": request.method,
+            "url": request.url,
+            "headers": _JSON_HEADERS,
+        }
+        if request.body is not None:
+            body = serialization.dumps(request.body).encode()
+            rest_request["body"] = base64.b64encode(body).decode()
+        rest_requests.append(rest_request)
+
+    response = get_session().post(
+        f"{config.instance_url}/api/now/v1/batch",
+        json={"batch_request_id": "1", "rest_requests": rest_requests},
+        headers=auth_manager.get_headers(),
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
+    data = serialization.loads(response.content)
+
+    results = {}
+    for serviced in data.get("serviced_requests", []):
+        body = serviced.get("body")
+        if body:
+            try:
+                body = serialization.loads(base64.b64decode(body))
+            except ValueError:
+                logger.warning(f"Could not decode body of batch request {serviced.get('id')}")
+        results[serviced.get("id")] = BatchResult(serviced.get("status_code", 0), body)
+
+    for request_id in data.get("unserviced_requests", []):
+        results[request_id] = BatchResult(0, None)
+
+    return results
@@ -0,0 +1,88 @@
+"""
+Response cache for the ServiceNow MCP server.
+
+Read-only tools (``list_*`` and ``get_*``) are often called repeatedly with the
+same parameters. Their results are kept for a short time so that repeated
+calls do not go back to the ServiceNow REST API.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    A least-recently-used cache whose entries expire after a fixed time.
+
+    Keys are tuples whose first item is a namespace (the tool group), so that
+    all entries of a group can be dropped when one of its tools changes data.
+    The cache is safe to use from several threads.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Number of seconds an entry stays valid.
+            maxsize: Maximum number of entries kept.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Tuple[bool, Any]: Whether a valid entry was found, and its value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: Hashable) -> None:
+        """
+        Drop every entry whose key starts with the given namespace.
+
+        Args:
+            namespace: The namespace to drop, e.g. a tool group name.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -3,9 +3,9 @@ Configuration module for the ServiceNow MCP server.
 """
 
 from enum import Enum
-from typing import Dict, Optional, Union
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class AuthType(str, Enum):
@@ -56,6 +56,10 @@ class ServerConfig(BaseModel):
     auth: AuthConfig
     debug: bool = False
     timeout: int = 30
+    enabled_tool_groups: Optional[List[str]] = None
+    cache_ttl: int = 60
+    prewarm: bool = False
+    schema_cache_dir: Optional[str] = None
     
     @property
     def api_url(self) -> str:
@@ -0,0 +1,116 @@
+"""
+HTTP session for the ServiceNow MCP server.
+
+All requests to ServiceNow go through one shared requests.Session so that
+TCP/TLS connections are pooled and reused between tool calls instead of being
+negotiated again for every request.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of connection pools to keep, and connections to keep per pool
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Retry idempotent requests (GET, PUT, DELETE, ...) that fail with these
+# statuses or with connection errors. POST and PATCH are never retried, so a
+# record is not created or changed twice. Retry-After headers are honoured, up
+# to RETRY_AFTER_MAX seconds so that a long wait does not hold a worker thread.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_TOTAL = 2
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_AFTER_MAX = 5.0
+
+# Worker threads used to send independent requests of one tool concurrently
+CONCURRENT_REQUESTS = 8
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+class _CappedRetry(Retry):
+    """A retry policy that waits at most RETRY_AFTER_MAX seconds for Retry-After."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        """Get the Retry-After delay of a response, capped at RETRY_AFTER_MAX."""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session: The session used for all ServiceNow requests.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retries = _CappedRetry(
+                    total=RETRY_TOTAL,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUSES,
+                    # Return the last response so that tools report its error
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=retries,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                # Every request carries its own auth headers; don't let cookies
+                # from one set of credentials leak into requests made with another
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                _session = session
+    return _session
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent blocking calls, such as requests to ServiceNow, concurrently.
+
+    Args:
+        *calls: Functions taking no arguments.
+
+    Returns:
+        List[Any]: The results of the calls, in the order the calls were given.
+
+    Raises:
+        Exception: The first exception raised by any of the calls, in call order.
+    """
+    global _executor
+    if len(calls) < 2:
+        return [call() for call in calls]
+
+    if _executor is None:
+        with _session_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=CONCURRENT_REQUESTS, thread_name_prefix="servicenow-http"
+                )
+    futures = [_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
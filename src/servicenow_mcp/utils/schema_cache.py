@@ -0,0 +1,145 @@
+"""
+On-disk cache of tool input schemas for the ServiceNow MCP server.
+
+Generating the JSON schema of every tool's parameters is the largest part of
+server startup. With a schema cache directory configured, the schemas are
+written to disk after the first start and read back on later starts.
+
+Entries are keyed by the tool's name and description and by the source of the
+modules that define its parameter models. The cache file name also includes
+the versions of this package, MCP and pydantic. Editing a tool module or
+upgrading a dependency therefore never reuses a stale schema.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _package_version(name: str) -> str:
+    """Get the installed version of a package, or an empty string."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def _module_digest(module_name: str) -> str:
+    """Hash the source file of a module, or return an empty string if it has none."""
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if not path:
+        return ""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+def schema_key(name: str, description: Optional[str], annotations: Iterable[Any]) -> str:
+    """
+    Build the cache key of a tool.
+
+    Args:
+        name: The tool name.
+        description: The tool description.
+        annotations: The type annotations of the tool function's parameters.
+
+    Returns:
+        str: The cache key.
+    """
+    digest = hashlib.sha256(f"{name}\0{description}".encode())
+    for annotation in annotations:
+        module = getattr(annotation, "__module__", "")
+        qualname = getattr(annotation, "__qualname__", repr(annotation))
+        digest.update(f"\0{module}.{qualname}\0{_module_digest(module)}".encode())
+    return f"{name}:{digest.hexdigest()}"
+
+
+class SchemaCache:
+    """Tool input schemas loaded from and saved to a JSON file."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize the cache, loading any schemas saved by an earlier start.
+
+        Args:
+            directory: Directory that holds the cache file. It is created on save.
+        """
+        from servicenow_mcp import __version__
+
+        environment = "\0".join(
+            (__version__, _package_version("mcp"), _package_version("pydantic"))
+        )
+        file_name = f"schemas-{hashlib.sha256(environment.encode()).hexdigest()[:16]}.json"
+        self.path = os.path.join(os.path.expanduser(directory), file_name)
+        self._schemas: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file, treating a missing or unreadable file as empty."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                schemas = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable schema cache {self.path}: {e}")
+            return {}
+        return schemas if isinstance(schemas, dict) else {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached schema.
+
+        Args:
+            key: The cache key, from schema_key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The schema, or None if it is not cached.
+        """
+        return self._schemas.get(key)
+
+    def set(self, key: str, schema: Dict[str, Any]) -> None:
+        """
+        Store a schema. It is written to disk by the next call to save.
+
+        Args:
+            key: The cache key, from schema_key.
+            schema: The JSON schema of the tool's parameters.
+        """
+        self._schemas[key] = schema
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if any schema was added since it was loaded."""
+        if not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so that a concurrent start never
+            # reads a partially written cache
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._schemas, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write schema cache {self.path}: {e}")
+            return
+
+        self._dirty = False
@@ -0,0 +1,67 @@
+"""
+JSON serialization helpers for the ServiceNow MCP server.
+
+orjson is used when it is installed (``pip install servicenow-mcp[performance]``),
+otherwise these helpers fall back to the standard library json module.
+"""
+
+import json
+from typing import Any, Union
+
+from pydantic import BaseModel
+from requests.exceptions import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Raw JSON, typically a response body as bytes.
+
+    Returns:
+        Any: The decoded Python object.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the data is not valid JSON. This
+            is what requests' Response.json() raises, so callers that handle
+            requests.RequestException also handle an unparsable body.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as e:
+        raise JSONDecodeError(
+            getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0)
+        ) from e
+
+
+def _default(obj: Any) -> Any:
+    """Serialize pydantic models, which neither encoder handles natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: The object to serialize, typically a tool result.
+
+    Returns:
+        str: The JSON document.
+    """
+    if isinstance(obj, BaseModel):
+        # pydantic-core writes the JSON directly, without building a dict first
+        return obj.model_dump_json()
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_default)
@@ -0,0 +1,119 @@
+"""
+Tests for the authentication manager.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, OAuthConfig
+
+
+def _oauth_manager():
+    """Create an AuthManager for OAuth with a fixed token URL."""
+    return AuthManager(
+        AuthConfig(
+            type=AuthType.OAUTH,
+            oauth=OAuthConfig(
+                client_id="client",
+                client_secret="secret",
+                username="admin",
+                password="password",
+                token_url="https://example.service-now.com/oauth_token.do",
+            ),
+        )
+    )
+
+
+class TestAuthManager(unittest.TestCase):
+    """Tests for the AuthManager class."""
+
+    def test_basic_headers_are_cached(self):
+        """Test that basic auth headers are built once and returned as copies."""
+        auth_manager = AuthManager(
+            AuthConfig(
+                type=AuthType.BASIC,
+                basic=BasicAuthConfig(username="admin", password="password"),
+            )
+        )
+
+        with patch(
+            "servicenow_mcp.auth.auth_manager.base64.b64encode", return_value=b"abc"
+        ) as mock_encode:
+            headers = auth_manager.get_headers()
+            headers["Content-Type"] = "text/plain"
+            again = auth_manager.get_headers()
+
+        mock_encode.assert_called_once()
+        self.assertEqual(again["Authorization"], "Basic abc")
+        self.assertEqual(again["Content-Type"], "application/json")
+
+    @patch("requests.Session.post")
+    def test_oauth_token_refreshed_before_expiry(self, mock_post):
+        """Test that the OAuth token is reused until it is about to expire."""
+        mock_response = MagicMock()
+        mock_response.json.side_effect = [
+            {"access_token": "first", "token_type": "Bearer", "expires_in": 1800},
+            {"access_token": "second", "token_type": "Bearer", "expires_in": 1800},
+        ]
+        mock_post.return_value = mock_response
+        auth_manager = _oauth_manager()
+
+        with patch("servicenow_mcp.auth.auth_manager.time.monotonic", return_value=1000.0):
+            self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer first")
+            self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer first")
+        self.assertEqual(mock_post.call_count, 1)
+
+        # Within the refresh margin of the 1800 second lifetime
+        with patch("servicenow_mcp.auth.auth_manager.time.monotonic", return_value=2780.0):
+            self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer second")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("requests.Session.post")
+    def test_concurrent_callers_fetch_one_token(self, mock_post):
+        """Test that threads asking for headers at once share a single token request."""
+        requested = threading.Event()
+        release = threading.Event()
+
+        def post(*args, **kwargs):
+            requested.set()
+            release.wait(5)
+            response = MagicMock()
+            response.json.return_value = {"access_token": "token", "expires_in": 1800}
+            return response
+
+        mock_post.side_effect = post
+        auth_manager = _oauth_manager()
+        results = []
+
+        def get_headers():
+            results.append(auth_manager.get_headers()["Authorization"])
+
+        threads = [threading.Thread(target=get_headers) for _ in range(4)]
+        threads[0].start()
+        requested.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        mock_post.assert_called_once()
+        self.assertEqual(results, ["Bearer token"] * 4)
+
+    @patch("requests.Session.post")
+    def test_oauth_token_without_usable_expiry(self, mock_post):
+        """Test that a token whose expires_in is not a number is kept without expiry."""
+        mock_post.return_value.json.return_value = {
+            "access_token": "token",
+            "expires_in": "soon",
+        }
+        auth_manager = _oauth_manager()
+
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer token")
+        self.assertIsNone(auth_manager.token_expires_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
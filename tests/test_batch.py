@@ -0,0 +1,60 @@
+"""
+Tests for the ServiceNow Batch API helper.
+"""
+
+import base64
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.batch import BatchRequest, BatchResult, submit_batch
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+
+
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for submit_batch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = ServerConfig(
+            instance_url="https://example.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC,
+                basic=BasicAuthConfig(username="admin", password="password"),
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+
+    @patch("requests.Session.post")
+    def test_submit_batch(self, mock_post):
+        """Test that bodies are encoded and results are decoded per request."""
+        result_body = base64.b64encode(json.dumps({"result": {"sys_id": "abc"}}).encode()).decode()
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "serviced_requests": [{"id": "a", "status_code": 200, "body": result_body}],
+            "unserviced_requests": ["b"],
+        }).encode()
+        mock_post.return_value = mock_response
+
+        results = submit_batch(
+            self.config,
+            self.auth_manager,
+            [
+                BatchRequest("a", "PATCH", "/api/now/table/incident/abc", {"state": "2"}),
+                BatchRequest("b", "GET", "/api/now/table/incident/def"),
+            ],
+        )
+
+        self.assertEqual(results["a"], BatchResult(200, {"result": {"sys_id": "abc"}}))
+        self.assertEqual(results["b"], BatchResult(0, None))
+
+        args, kwargs = mock_post.call_args
+        self.assertEqual(args[0], "https://example.service-now.com/api/now/v1/batch")
+        rest_requests = kwargs["json"]["rest_requests"]
+        self.assertEqual(json.loads(base64.b64decode(rest_requests[0]["body"])), {"state": "2"})
+        self.assertNotIn("body", rest_requests[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+Tests for the response cache.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.tools.incident_tools import ListIncidentsParams
+from servicenow_mcp.utils.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for the TTLCache class."""
+
+    def test_get_and_set(self):
+        """Test that stored values are returned until they expire."""
+        cache = TTLCache(ttl=60)
+        self.assertEqual(cache.get(("incident", "list_incidents", "{}")), (False, None))
+
+        cache.set(("incident", "list_incidents", "{}"), {"success": True})
+        self.assertEqual(
+            cache.get(("incident", "list_incidents", "{}")), (True, {"success": True})
+        )
+
+        with patch("servicenow_mcp.utils.cache.time.monotonic", return_value=float("inf")):
+            self.assertEqual(cache.get(("incident", "list_incidents", "{}")), (False, None))
+
+    def test_maxsize_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set(("a", 1), 1)
+        cache.set(("a", 2), 2)
+        cache.get(("a", 1))
+        cache.set(("a", 3), 3)
+
+        self.assertTrue(cache.get(("a", 1))[0])
+        self.assertFalse(cache.get(("a", 2))[0])
+        self.assertTrue(cache.get(("a", 3))[0])
+
+    def test_invalidate_namespace(self):
+        """Test that invalidating a namespace keeps other namespaces."""
+        cache = TTLCache(ttl=60)
+        cache.set(("incident", "list_incidents"), 1)
+        cache.set(("user", "list_users"), 2)
+
+        cache.invalidate("incident")
+
+        self.assertFalse(cache.get(("incident", "list_incidents"))[0])
+        self.assertTrue(cache.get(("user", "list_users"))[0])
+
+
+class TestServerResponseCache(unittest.TestCase):
+    """Tests for caching read-only tool results in the server."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "instance_url": "https://example.service-now.com",
+            "auth": {
+                "type": "basic",
+                "basic": {
+                    "username": "admin",
+                    "password": "password",
+                },
+            },
+            "enabled_tool_groups": [],
+        }
+        self.server = ServiceNowMCP(self.config)
+        self.params = ListIncidentsParams(limit=5)
+
+    def _tool(self, name, result):
+        """Create a mock tool function with the given name."""
+        tool = MagicMock(return_value=result)
+        tool.__name__ = name
+        return tool
+
+    def test_read_only_tool_is_cached(self):
+        """Test that a repeated read-only call does not call the tool again."""
+        tool = self._tool("list_incidents", {"success": True, "incidents": []})
+
+        first = self.server._call_tool("incident", tool, self.params)
+        second = self.server._call_tool("incident", tool, self.params)
+
+        self.assertEqual(first, second)
+        tool.assert_called_once()
+
+    def test_failed_result_is_not_cached(self):
+        """Test that failed calls are retried."""
+        tool = self._tool("list_incidents", {"success": False, "message": "error"})
+
+        self.server._call_tool("incident", tool, self.params)
+        self.server._call_tool("incident", tool, self.params)
+
+        self.assertEqual(tool.call_count, 2)
+
+    def test_mutating_tool_invalidates_group(self):
+        """Test that a mutating tool clears the cached results of its group."""
+        list_tool = self._tool("list_incidents", {"success": True, "incidents": []})
+        update_tool = self._tool("update_incident", {"success": True})
+
+        self.server._call_tool("incident", list_tool, self.params)
+        self.server._call_tool("incident", update_tool, self.params)
+        self.server._call_tool("incident", list_tool, self.params)
+
+        self.assertEqual(list_tool.call_count, 2)
+
+    def test_cache_disabled(self):
+        """Test that a cache TTL of 0 disables caching."""
+        server = ServiceNowMCP({**self.config, "cache_ttl": 0})
+        tool = self._tool("list_incidents", {"success": True, "incidents": []})
+
+        server._call_tool("incident", tool, self.params)
+        server._call_tool("incident", tool, self.params)
+
+        self.assertEqual(tool.call_count, 2)
+
+    def test_concurrent_identical_calls_are_coalesced(self):
+        """Test that an identical call made while one is running waits for its result."""
+        server = ServiceNowMCP({**self.config, "cache_ttl": 0})
+        started = threading.Event()
+        release = threading.Event()
+
+        def list_incidents(config, auth_manager, params):
+            started.set()
+            release.wait(5)
+            return {"success": True, "incidents": []}
+
+        tool = MagicMock(side_effect=list_incidents)
+        tool.__name__ = "list_incidents"
+        results = []
+
+        def call():
+            results.append(server._call_tool("incident", tool, self.params))
+
+        first = threading.Thread(target=call)
+        first.start()
+        started.wait(5)
+
+        # Only release the first call once the second one waits on its result
+        waiting = threading.Event()
+        future = next(iter(server._inflight.values()))
+        get_result = future.result
+
+        def wait_for_result(*args, **kwargs):
+            waiting.set()
+            return get_result(*args, **kwargs)
+
+        future.result = wait_for_result
+        second = threading.Thread(target=call)
+        second.start()
+        self.assertTrue(waiting.wait(5))
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        tool.assert_called_once()
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(server._inflight, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Tests for the catalog item variables tools.
 """
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 import requests
@@ -38,7 +39,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.auth_manager = MagicMock()
         self.auth_manager.get_headers.return_value = {"Content-Type": "application/json"}
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_catalog_item_variable(self, mock_post):
         """Test create_catalog_item_variable function."""
         # Configure mock
@@ -84,7 +85,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.assertEqual(call_args[1]["json"]["question_text"], "Test Variable")
         self.assertEqual(call_args[1]["json"]["mandatory"], "false")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_catalog_item_variable_with_optional_params(self, mock_post):
         """Test create_catalog_item_variable function with optional parameters."""
         # Configure mock
@@ -139,7 +140,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.assertEqual(call_args[1]["json"]["description"], "Reference to a user")
         self.assertEqual(call_args[1]["json"]["order"], 100)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_catalog_item_variable_error(self, mock_post):
         """Test create_catalog_item_variable function with error."""
         # Configure mock to raise exception
@@ -160,13 +161,13 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertTrue("failed" in result.message.lower())
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_catalog_item_variables(self, mock_get):
         """Test list_catalog_item_variables function."""
         # Configure mock
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "var1",
@@ -185,7 +186,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
                     "mandatory": "false",
                 },
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         # Create test params
@@ -216,13 +217,13 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.assertEqual(call_args[1]["params"]["sysparm_display_value"], "true")
         self.assertEqual(call_args[1]["params"]["sysparm_exclude_reference_link"], "false")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_catalog_item_variables_with_pagination(self, mock_get):
         """Test list_catalog_item_variables function with pagination parameters."""
         # Configure mock
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {"result": [{"sys_id": "var1"}]}
+        mock_response.content = json.dumps({"result": [{"sys_id": "var1"}]}).encode()
         mock_get.return_value = mock_response
 
         # Create test params with pagination
@@ -249,7 +250,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
             "sys_id,name,type,question_text,order,mandatory",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_catalog_item_variables_error(self, mock_get):
         """Test list_catalog_item_variables function with error."""
         # Configure mock to raise exception
@@ -267,7 +268,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertTrue("failed" in result.message.lower())
 
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_update_catalog_item_variable(self, mock_patch):
         """Test update_catalog_item_variable function."""
         # Configure mock
@@ -310,7 +311,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
         self.assertEqual(call_args[1]["json"]["mandatory"], "true")
         self.assertEqual(call_args[1]["json"]["help_text"], "This is help text")
 
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_update_catalog_item_variable_no_params(self, mock_patch):
         """Test update_catalog_item_variable function with no update parameters."""
         # Create test params with no updates (only ID)
@@ -328,7 +329,7 @@ class TestCatalogVariablesTools(unittest.TestCase):
         # Verify mock was not called
         mock_patch.assert_not_called()
 
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_update_catalog_item_variable_error(self, mock_patch):
         """Test update_catalog_item_variable function with error."""
         # Configure mock to raise exception
@@ -2,6 +2,7 @@
 Tests for the change management tools.
 """
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -9,7 +10,10 @@ import requests
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.tools.change_tools import (
+    GetChangeRequestDetailsParams,
+    _unwrap_and_validate_params,
     create_change_request,
+    get_change_request_details,
     list_change_requests,
 )
 from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
@@ -30,12 +34,12 @@ class TestChangeTools(unittest.TestCase):
         )
         self.auth_manager = AuthManager(self.auth_config)
 
-    @patch("servicenow_mcp.tools.change_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_change_requests_success(self, mock_get):
         """Test listing change requests successfully."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "change123",
@@ -52,7 +56,7 @@ class TestChangeTools(unittest.TestCase):
                     "state": "in progress",
                 },
             ]
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -71,12 +75,12 @@ class TestChangeTools(unittest.TestCase):
         self.assertEqual(result["change_requests"][0]["sys_id"], "change123")
         self.assertEqual(result["change_requests"][1]["sys_id"], "change456")
 
-    @patch("servicenow_mcp.tools.change_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_change_requests_empty_result(self, mock_get):
         """Test listing change requests with empty result."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"result": []}
+        mock_response.content = json.dumps({"result": []}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -93,12 +97,12 @@ class TestChangeTools(unittest.TestCase):
         self.assertEqual(result["count"], 0)
         self.assertEqual(result["total"], 0)
 
-    @patch("servicenow_mcp.tools.change_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_change_requests_missing_result(self, mock_get):
         """Test listing change requests with missing result key."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {}  # No "result" key
+        mock_response.content = json.dumps({}).encode()  # No "result" key
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -115,7 +119,7 @@ class TestChangeTools(unittest.TestCase):
         self.assertEqual(result["count"], 0)
         self.assertEqual(result["total"], 0)
 
-    @patch("servicenow_mcp.tools.change_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_change_requests_error(self, mock_get):
         """Test listing change requests with error."""
         # Mock the response
@@ -132,12 +136,12 @@ class TestChangeTools(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("Error listing change requests", result["message"])
 
-    @patch("servicenow_mcp.tools.change_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_change_requests_with_filters(self, mock_get):
         """Test listing change requests with filters."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "change123",
@@ -147,7 +151,7 @@ class TestChangeTools(unittest.TestCase):
                     "state": "open",
                 }
             ]
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -181,7 +185,7 @@ class TestChangeTools(unittest.TestCase):
         self.assertIn("short_description=Test", query)
         # The timeframe filter adds a date comparison, which is harder to test exactly
 
-    @patch("servicenow_mcp.tools.change_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_change_request_with_swapped_parameters(self, mock_post):
         """Test creating a change request with swapped parameters (server_config used as auth_manager)."""
         # Mock the response
@@ -216,7 +220,7 @@ class TestChangeTools(unittest.TestCase):
         self.assertEqual(result["change_request"]["sys_id"], "change123")
         self.assertEqual(result["change_request"]["number"], "CHG0010001")
 
-    @patch("servicenow_mcp.tools.change_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_change_request_with_serverconfig_no_get_headers(self, mock_post):
         """Test creating a change request with ServerConfig object that doesn't have get_headers method."""
         # This test simulates the exact error we're seeing in Claude Desktop
@@ -251,7 +255,7 @@ class TestChangeTools(unittest.TestCase):
         # Verify that the post method was never called
         mock_post.assert_not_called()
 
-    @patch("servicenow_mcp.tools.change_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_change_request_with_swapped_parameters_real(self, mock_post):
         """Test creating a change request with swapped parameters (auth_manager and server_config)."""
         # Mock the response
@@ -283,6 +287,54 @@ class TestChangeTools(unittest.TestCase):
         self.assertEqual(result["change_request"]["sys_id"], "change123")
         self.assertEqual(result["change_request"]["number"], "CHG0010001")
 
+    @patch("requests.Session.get")
+    def test_get_change_request_details(self, mock_get):
+        """Test that a change request and its tasks are both returned."""
+        def get(url, **kwargs):
+            response = MagicMock()
+            if url.endswith("/change_task"):
+                response.json.return_value = {"result": [{"sys_id": "task1"}]}
+            else:
+                response.json.return_value = {"result": {"sys_id": "change123"}}
+            return response
+
+        mock_get.side_effect = get
+
+        result = get_change_request_details(
+            self.auth_manager, self.server_config, {"change_id": "change123"}
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["change_request"], {"sys_id": "change123"})
+        self.assertEqual(result["tasks"], [{"sys_id": "task1"}])
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.Session.get")
+    def test_get_change_request_details_error(self, mock_get):
+        """Test that a failed request is reported as an unsuccessful result."""
+        mock_get.side_effect = requests.exceptions.RequestException("boom")
+
+        result = get_change_request_details(
+            self.auth_manager, self.server_config, {"change_id": "change123"}
+        )
+
+        self.assertFalse(result["success"])
+        self.assertIn("boom", result["message"])
+
+
+    def test_validated_params_are_used_as_is(self):
+        """Test that a params model of the expected class is not validated again."""
+        params = GetChangeRequestDetailsParams(change_id="change123")
+
+        with patch.object(GetChangeRequestDetailsParams, "model_dump") as mock_model_dump:
+            result = _unwrap_and_validate_params(
+                params, GetChangeRequestDetailsParams, required_fields=["change_id"]
+            )
+
+        self.assertTrue(result["success"])
+        self.assertIs(result["params"], params)
+        mock_model_dump.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
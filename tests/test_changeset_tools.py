@@ -4,6 +4,7 @@ Tests for the changeset tools.
 This module contains tests for the changeset tools in the ServiceNow MCP server.
 """
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -46,12 +47,12 @@ class TestChangesetTools(unittest.TestCase):
         self.auth_manager = MagicMock(spec=AuthManager)
         self.auth_manager.get_headers.return_value = {"Authorization": "Bearer test"}
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_changesets(self, mock_get):
         """Test listing changesets."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "123",
@@ -61,7 +62,7 @@ class TestChangesetTools(unittest.TestCase):
                     "developer": "test.user",
                 }
             ]
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -93,7 +94,7 @@ class TestChangesetTools(unittest.TestCase):
         self.assertIn("application=Test App", kwargs["params"]["sysparm_query"])
         self.assertIn("developer=test.user", kwargs["params"]["sysparm_query"])
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.get")
+    @patch("requests.Session.get")
     def test_get_changeset_details(self, mock_get):
         """Test getting changeset details."""
         # Mock responses
@@ -160,7 +161,7 @@ class TestChangesetTools(unittest.TestCase):
         self.assertEqual(second_call_kwargs["headers"], {"Authorization": "Bearer test"})
         self.assertEqual(second_call_kwargs["params"]["sysparm_query"], "update_set=123")
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_changeset(self, mock_post):
         """Test creating a changeset."""
         # Mock response
@@ -202,7 +203,7 @@ class TestChangesetTools(unittest.TestCase):
         self.assertEqual(kwargs["json"]["developer"], "test.user")
         self.assertEqual(kwargs["json"]["description"], "Test description")
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_update_changeset(self, mock_patch):
         """Test updating a changeset."""
         # Mock response
@@ -244,7 +245,7 @@ class TestChangesetTools(unittest.TestCase):
         self.assertEqual(kwargs["json"]["name"], "Updated Changeset")
         self.assertEqual(kwargs["json"]["state"], "in_progress")
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_commit_changeset(self, mock_patch):
         """Test committing a changeset."""
         # Mock response
@@ -285,7 +286,7 @@ class TestChangesetTools(unittest.TestCase):
         self.assertEqual(kwargs["json"]["state"], "complete")
         self.assertEqual(kwargs["json"]["description"], "Commit message")
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_publish_changeset(self, mock_patch):
         """Test publishing a changeset."""
         # Mock response
@@ -326,7 +327,7 @@ class TestChangesetTools(unittest.TestCase):
         self.assertEqual(kwargs["json"]["state"], "published")
         self.assertEqual(kwargs["json"]["description"], "Publish notes")
 
-    @patch("servicenow_mcp.tools.changeset_tools.requests.post")
+    @patch("requests.Session.post")
     def test_add_file_to_changeset(self, mock_post):
         """Test adding a file to a changeset."""
         # Mock response
@@ -0,0 +1,71 @@
+"""
+Tests for the shared HTTP session.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from urllib3 import HTTPResponse
+
+from servicenow_mcp.utils import http
+
+
+class TestHttpSession(unittest.TestCase):
+    """Tests for the shared HTTP session helpers."""
+
+    def tearDown(self):
+        """Close the session created by the test."""
+        http.close_session()
+
+    def test_session_is_shared(self):
+        """Test that the same pooled session is returned on every call."""
+        session = http.get_session()
+
+        self.assertIs(http.get_session(), session)
+        adapter = session.get_adapter("https://example.service-now.com")
+        self.assertEqual(adapter._pool_maxsize, http.POOL_MAXSIZE)
+
+    def test_only_idempotent_requests_are_retried(self):
+        """Test that failed GETs are retried but POSTs and PATCHes are not."""
+        retries = http.get_session().get_adapter("https://example.service-now.com").max_retries
+
+        self.assertEqual(retries.total, http.RETRY_TOTAL)
+        self.assertIn(503, retries.status_forcelist)
+        self.assertTrue(retries.is_retry("GET", 503))
+        self.assertFalse(retries.is_retry("POST", 503))
+        self.assertFalse(retries.is_retry("PATCH", 503))
+
+    @patch("urllib3.util.retry.time.sleep")
+    def test_retry_after_is_capped(self, mock_sleep):
+        """Test that a long Retry-After header does not block the request for that long."""
+        retries = http.get_session().get_adapter("https://example.service-now.com").max_retries
+        retries = retries.increment("GET", "/api/now/table/incident")
+        response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+
+        retries.sleep(response)
+
+        mock_sleep.assert_called_once_with(http.RETRY_AFTER_MAX)
+
+    def test_close_session(self):
+        """Test that closing the session makes the next call create a new one."""
+        session = http.get_session()
+
+        http.close_session()
+
+        self.assertIsNot(http.get_session(), session)
+
+    def test_run_concurrently_keeps_order(self):
+        """Test that results are returned in call order."""
+        self.assertEqual(http.run_concurrently(lambda: 1, lambda: 2, lambda: 3), [1, 2, 3])
+
+    def test_run_concurrently_raises(self):
+        """Test that an exception raised by a call is re-raised."""
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaisesRegex(ValueError, "boom"):
+            http.run_concurrently(lambda: 1, fail)
+
+
+if __name__ == "__main__":
+    unittest.main()
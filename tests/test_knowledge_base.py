@@ -4,6 +4,7 @@ Tests for the knowledge base tools.
 This module contains tests for the knowledge base tools in the ServiceNow MCP server.
 """
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -58,7 +59,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
             "Content-Type": "application/json",
         }
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.post")
+    @patch("requests.Session.post")
     def test_create_knowledge_base(self, mock_post):
         """Test creating a knowledge base."""
         # Mock response
@@ -101,7 +102,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual("admin", kwargs["json"]["owner"])
         self.assertEqual("it_managers", kwargs["json"]["kb_managers"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.post")
+    @patch("requests.Session.post")
     def test_create_category(self, mock_post):
         """Test creating a category."""
         # Mock response
@@ -143,7 +144,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual("kb001", kwargs["json"]["kb_knowledge_base"])
         self.assertEqual("true", kwargs["json"]["active"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.post")
+    @patch("requests.Session.post")
     def test_create_article(self, mock_post):
         """Test creating a knowledge article."""
         # Mock response
@@ -192,7 +193,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual("text", kwargs["json"]["article_type"])
         self.assertEqual("test,article,knowledge", kwargs["json"]["keywords"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.patch")
+    @patch("requests.Session.patch")
     def test_update_article(self, mock_patch):
         """Test updating a knowledge article."""
         # Mock response
@@ -235,7 +236,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual("cat002", kwargs["json"]["kb_category"])
         self.assertEqual("updated,article,knowledge", kwargs["json"]["keywords"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.patch")
+    @patch("requests.Session.patch")
     def test_publish_article(self, mock_patch):
         """Test publishing a knowledge article."""
         # Mock response
@@ -270,12 +271,12 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual(self.auth_manager.get_headers(), kwargs["headers"])
         self.assertEqual("published", kwargs["json"]["workflow_state"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.get")
+    @patch("requests.Session.get")
     def test_list_articles(self, mock_get):
         """Test listing knowledge articles."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "art001",
@@ -296,7 +297,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
                     "sys_updated_on": "2023-01-04 00:00:00",
                 }
             ]
-        }
+        }).encode()
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -335,7 +336,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertIn("kb_knowledge_base.sys_id=kb001", query)
         self.assertIn("kb_category.sys_id=cat001", query)
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.get")
+    @patch("requests.Session.get")
     def test_get_article(self, mock_get):
         """Test getting a knowledge article."""
         # Mock response
@@ -383,7 +384,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual(self.auth_manager.get_headers(), kwargs["headers"])
         self.assertEqual("true", kwargs["params"]["sysparm_display_value"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.post")
+    @patch("requests.Session.post")
     def test_create_knowledge_base_error(self, mock_post):
         """Test error handling when creating a knowledge base."""
         # Mock error response
@@ -397,7 +398,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("Failed to create knowledge base", result.message)
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.get")
+    @patch("requests.Session.get")
     def test_get_article_not_found(self, mock_get):
         """Test getting a non-existent article."""
         # Mock empty response
@@ -414,12 +415,12 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("not found", result["message"])
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.get")
+    @patch("requests.Session.get")
     def test_list_knowledge_bases(self, mock_get):
         """Test listing knowledge bases."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "kb001",
@@ -442,7 +443,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
                     "sys_updated_on": "2023-01-04 00:00:00",
                 }
             ]
-        }
+        }).encode()
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -474,13 +475,14 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual(0, kwargs["params"]["sysparm_offset"])
         self.assertEqual("true", kwargs["params"]["sysparm_display_value"])
         self.assertEqual("active=true^titleLIKEIT^ORdescriptionLIKEIT", kwargs["params"]["sysparm_query"])
+        self.assertIn("kb_managers", kwargs["params"]["sysparm_fields"].split(","))
 
-    @patch("servicenow_mcp.tools.knowledge_base.requests.get")
+    @patch("requests.Session.get")
     def test_list_categories(self, mock_get):
         """Test listing categories in a knowledge base."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "cat001",
@@ -503,7 +505,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
                     "sys_updated_on": "2023-01-04 00:00:00",
                 }
             ]
-        }
+        }).encode()
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -0,0 +1,97 @@
+"""
+Tests for the on-disk tool schema cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from servicenow_mcp.server import _TOOL_TEMPLATES, ServiceNowMCP
+from servicenow_mcp.utils.schema_cache import SchemaCache, schema_key
+
+
+class ExampleParams(BaseModel):
+    """Parameters used to build cache keys."""
+
+    name: str
+
+
+class TestSchemaCache(unittest.TestCase):
+    """Test cases for SchemaCache."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "cache")
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.tmp.cleanup()
+
+    def test_schemas_survive_reload(self):
+        """Test that saved schemas are loaded by a new cache."""
+        cache = SchemaCache(self.directory)
+        cache.set("tool:abc", {"type": "object"})
+        cache.save()
+
+        self.assertEqual(SchemaCache(self.directory).get("tool:abc"), {"type": "object"})
+
+    def test_unreadable_file_is_ignored(self):
+        """Test that a corrupt cache file is treated as empty."""
+        cache = SchemaCache(self.directory)
+        os.makedirs(self.directory)
+        with open(cache.path, "w") as f:
+            f.write("not json")
+
+        self.assertIsNone(SchemaCache(self.directory).get("tool:abc"))
+
+    def test_key_depends_on_description_and_params(self):
+        """Test that the key changes with the tool description and params model."""
+        key = schema_key("tool", "Description", [ExampleParams])
+
+        self.assertEqual(key, schema_key("tool", "Description", [ExampleParams]))
+        self.assertNotEqual(key, schema_key("tool", "Other description", [ExampleParams]))
+        self.assertNotEqual(key, schema_key("tool", "Description", [str]))
+
+
+class TestServerSchemaCache(unittest.TestCase):
+    """Test cases for using the schema cache when registering tools."""
+
+    def setUp(self):
+        """Set up a config with a temporary schema cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = {
+            "instance_url": "https://example.service-now.com",
+            "auth": {"type": "basic", "basic": {"username": "admin", "password": "password"}},
+            "enabled_tool_groups": ["incident"],
+            "schema_cache_dir": self.tmp.name,
+        }
+        self.templates = dict(_TOOL_TEMPLATES)
+        _TOOL_TEMPLATES.clear()
+
+    def tearDown(self):
+        """Restore the in-process tool templates and remove the cache directory."""
+        _TOOL_TEMPLATES.clear()
+        _TOOL_TEMPLATES.update(self.templates)
+        self.tmp.cleanup()
+
+    def test_second_start_reads_schemas_from_disk(self):
+        """Test that a new process would not regenerate cached schemas."""
+        first = ServiceNowMCP(self.config)
+        # Simulate a new process, which starts without in-memory templates
+        _TOOL_TEMPLATES.clear()
+
+        with patch("servicenow_mcp.server.Tool.from_function") as mock_from_function:
+            second = ServiceNowMCP(self.config)
+
+        mock_from_function.assert_not_called()
+        first_tool = first.mcp_server._tool_manager.get_tool("list_incidents")
+        second_tool = second.mcp_server._tool_manager.get_tool("list_incidents")
+        self.assertEqual(first_tool.parameters, second_tool.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
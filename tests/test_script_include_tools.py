@@ -4,6 +4,7 @@ Tests for the script include tools.
 This module contains tests for the script include tools in the ServiceNow MCP server.
 """
 
+import json
 import unittest
 import requests
 from unittest.mock import MagicMock, patch
@@ -47,12 +48,12 @@ class TestScriptIncludeTools(unittest.TestCase):
             "Content-Type": "application/json",
         }
 
-    @patch("servicenow_mcp.tools.script_include_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_script_includes(self, mock_get):
         """Test listing script includes."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "123",
@@ -69,7 +70,7 @@ class TestScriptIncludeTools(unittest.TestCase):
                     "sys_updated_by": {"display_value": "admin"}
                 }
             ]
-        }
+        }).encode()
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -100,12 +101,12 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertEqual(0, kwargs["params"]["sysparm_offset"])
         self.assertEqual("active=true^client_callable=true^nameLIKETest", kwargs["params"]["sysparm_query"])
 
-    @patch("servicenow_mcp.tools.script_include_tools.requests.get")
+    @patch("requests.Session.get")
     def test_get_script_include(self, mock_get):
         """Test getting a script include."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": {
                 "sys_id": "123",
                 "name": "TestScriptInclude",
@@ -120,7 +121,7 @@ class TestScriptIncludeTools(unittest.TestCase):
                 "sys_created_by": {"display_value": "admin"},
                 "sys_updated_by": {"display_value": "admin"}
             }
-        }
+        }).encode()
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -142,7 +143,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertEqual(self.auth_manager.get_headers(), kwargs["headers"])
         self.assertEqual("name=123", kwargs["params"]["sysparm_query"])
 
-    @patch("servicenow_mcp.tools.script_include_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_script_include(self, mock_post):
         """Test creating a script include."""
         # Mock response
@@ -184,7 +185,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertEqual("public", kwargs["json"]["access"])
 
     @patch("servicenow_mcp.tools.script_include_tools.get_script_include")
-    @patch("servicenow_mcp.tools.script_include_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_update_script_include(self, mock_patch, mock_get_script_include):
         """Test updating a script include."""
         # Mock get_script_include response
@@ -237,7 +238,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertEqual("false", kwargs["json"]["client_callable"])
 
     @patch("servicenow_mcp.tools.script_include_tools.get_script_include")
-    @patch("servicenow_mcp.tools.script_include_tools.requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_script_include(self, mock_delete, mock_get_script_include):
         """Test deleting a script include."""
         # Mock get_script_include response
@@ -270,7 +271,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertEqual(f"{self.server_config.instance_url}/api/now/table/sys_script_include/123", args[0])
         self.assertEqual(self.auth_manager.get_headers(), kwargs["headers"])
 
-    @patch("servicenow_mcp.tools.script_include_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_script_includes_error(self, mock_get):
         """Test listing script includes with an error."""
         # Mock response
@@ -284,7 +285,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("Error listing script includes", result["message"])
 
-    @patch("servicenow_mcp.tools.script_include_tools.requests.get")
+    @patch("requests.Session.get")
     def test_get_script_include_error(self, mock_get):
         """Test getting a script include with an error."""
         # Mock response
@@ -298,7 +299,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("Error getting script include", result["message"])
 
-    @patch("servicenow_mcp.tools.script_include_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_script_include_error(self, mock_post):
         """Test creating a script include with an error."""
         # Mock response
@@ -0,0 +1,68 @@
+"""
+Tests for the JSON serialization helpers.
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+from pydantic import BaseModel
+
+from servicenow_mcp.utils import serialization
+
+
+class _Record(BaseModel):
+    """A simple model used in the tests."""
+
+    number: str
+    active: bool
+
+
+class TestSerialization(unittest.TestCase):
+    """Tests for the serialization helpers."""
+
+    def test_loads_bytes(self):
+        """Test parsing a response body given as bytes."""
+        self.assertEqual(serialization.loads(b'{"result": [1, 2]}'), {"result": [1, 2]})
+
+    def test_loads_invalid_json(self):
+        """Test that an unparsable body raises the same error as requests."""
+        for orjson in (serialization.orjson, None):
+            with patch.object(serialization, "orjson", orjson):
+                with self.assertRaises(requests.exceptions.JSONDecodeError):
+                    serialization.loads(b"<html><body>Log in</body></html>")
+
+    def test_dumps_round_trip(self):
+        """Test that dumps returns a JSON string, including nested models."""
+        data = {"success": True, "record": _Record(number="INC0010001", active=True)}
+
+        output = serialization.dumps(data)
+
+        self.assertIsInstance(output, str)
+        self.assertEqual(
+            json.loads(output),
+            {"success": True, "record": {"number": "INC0010001", "active": True}},
+        )
+
+    def test_dumps_model(self):
+        """Test that a model passed directly is serialized by pydantic."""
+        output = serialization.dumps(_Record(number="INC0010001", active=True))
+
+        self.assertEqual(json.loads(output), {"number": "INC0010001", "active": True})
+
+    def test_dumps_without_orjson(self):
+        """Test the standard library fallback."""
+        with patch.object(serialization, "orjson", None):
+            output = serialization.dumps({"record": _Record(number="INC0010001", active=False)})
+
+        self.assertEqual(json.loads(output), {"record": {"number": "INC0010001", "active": False}})
+
+    def test_dumps_rejects_unknown_types(self):
+        """Test that unsupported objects raise TypeError."""
+        with self.assertRaises(TypeError):
+            serialization.dumps({"value": object()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for how the ServiceNow MCP server runs registered tools.
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mcp.server.fastmcp.exceptions import ToolError
+
+from servicenow_mcp.server import ServiceNowMCP
+
+
+class TestServerToolExecution(unittest.TestCase):
+    """Test cases for running registered tools."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "instance_url": "https://example.service-now.com",
+            "auth": {"type": "basic", "basic": {"username": "admin", "password": "password"}},
+        }
+
+    @patch("requests.Session.get")
+    def test_tools_run_in_worker_thread(self, mock_get):
+        """Test that blocking tool functions run off the event loop thread."""
+        threads = []
+
+        def get(*args, **kwargs):
+            threads.append(threading.current_thread())
+            response = MagicMock()
+            response.content = b'{"result": []}'
+            return response
+
+        mock_get.side_effect = get
+        server = ServiceNowMCP({**self.config, "enabled_tool_groups": ["incident"]})
+
+        content = asyncio.run(server.mcp_server.call_tool("list_incidents", {"params": {}}))
+
+        self.assertIn("Found 0 incidents", content[0].text)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    @patch("servicenow_mcp.tools.knowledge_base.list_knowledge_bases")
+    def test_tool_exceptions_reach_fastmcp(self, mock_list_knowledge_bases):
+        """Test that tool exceptions are reported by FastMCP rather than swallowed."""
+        mock_list_knowledge_bases.__name__ = "list_knowledge_bases"
+        mock_list_knowledge_bases.side_effect = RuntimeError("boom")
+        server = ServiceNowMCP({**self.config, "enabled_tool_groups": ["knowledge_base"]})
+
+        with self.assertRaisesRegex(ToolError, "boom"):
+            asyncio.run(server.mcp_server.call_tool("list_knowledge_bases", {"params": {}}))
+
+
+if __name__ == "__main__":
+    unittest.main()
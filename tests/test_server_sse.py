@@ -0,0 +1,151 @@
+"""
+Tests for the SSE transport of the ServiceNow MCP server.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import ANY, MagicMock, patch
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from servicenow_mcp.server_sse import accept_batches, main, run_sse_server
+
+
+class TestAcceptBatches(unittest.TestCase):
+    """Test cases for JSON-RPC batch support on the message endpoint."""
+
+    def setUp(self):
+        """Set up a message handler that records the messages it accepts."""
+        self.received = []
+
+        async def handle_post_message(scope, receive, send):
+            message = await Request(scope, receive).json()
+            self.received.append(message)
+            status_code = 400 if message.get("method") == "bad" else 202
+            await Response("", status_code=status_code)(scope, receive, send)
+
+        self.app = accept_batches(handle_post_message)
+
+    def post(self, payload):
+        """Post a JSON payload to the wrapped handler and return the status code."""
+        body = json.dumps(payload).encode()
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/messages/",
+            "headers": [],
+            "query_string": b"",
+        }
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(self.app(scope, receive, send))
+        return sent[0]["status"]
+
+    def test_single_message(self):
+        """Test that a single message is passed on unchanged."""
+        message = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+
+        self.assertEqual(self.post(message), 202)
+        self.assertEqual(self.received, [message])
+
+    def test_batch_is_split_in_order(self):
+        """Test that every message of a batch is passed on in order."""
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call"},
+        ]
+
+        self.assertEqual(self.post(messages), 202)
+        self.assertEqual(self.received, messages)
+
+    def test_batch_reports_rejected_message(self):
+        """Test that a rejected message in a batch is reflected in the status code."""
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call"},
+            {"jsonrpc": "2.0", "id": 2, "method": "bad"},
+        ]
+
+        self.assertEqual(self.post(messages), 400)
+        self.assertEqual(len(self.received), 2)
+
+    def test_empty_batch(self):
+        """Test that an empty batch is rejected."""
+        self.assertEqual(self.post([]), 400)
+        self.assertEqual(self.received, [])
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the SSE server entry point."""
+
+    @patch("servicenow_mcp.server_sse.run_sse_server")
+    @patch("servicenow_mcp.server_sse.ServiceNowMCP")
+    @patch("servicenow_mcp.server_sse.configure_logging")
+    @patch("servicenow_mcp.server_sse.load_dotenv")
+    @patch("sys.argv", ["servicenow-mcp-sse"])
+    def test_missing_environment(self, mock_load_dotenv, mock_logging, mock_server, mock_run):
+        """Test that an incomplete environment is reported before the server is built."""
+        with patch.dict(
+            "os.environ", {"SERVICENOW_INSTANCE_URL": "https://example.service-now.com"}, clear=True
+        ), patch("sys.stderr"):
+            with self.assertRaises(SystemExit):
+                main()
+
+        mock_server.assert_not_called()
+        mock_run.assert_not_called()
+
+    @patch("servicenow_mcp.server_sse.run_sse_server")
+    @patch("servicenow_mcp.server_sse.ServiceNowMCP")
+    @patch("servicenow_mcp.server_sse.configure_logging")
+    @patch("servicenow_mcp.server_sse.load_dotenv")
+    @patch("sys.argv", ["servicenow-mcp-sse", "--port", "9000"])
+    def test_server_options_from_environment(
+        self, mock_load_dotenv, mock_logging, mock_server, mock_run
+    ):
+        """Test that the SSE server reads the same settings as the stdio server."""
+        environment = {
+            "SERVICENOW_INSTANCE_URL": "https://example.service-now.com",
+            "SERVICENOW_USERNAME": "admin",
+            "SERVICENOW_PASSWORD": "password",
+            "SERVICENOW_MCP_PREWARM": "1",
+            "SERVICENOW_MCP_TOOLS": "incident",
+            "SERVICENOW_CACHE_TTL": "0",
+            "SERVICENOW_MCP_SCHEMA_CACHE": "/tmp/schemas",
+        }
+        with patch.dict("os.environ", environment, clear=True):
+            main()
+
+        config = mock_server.call_args[0][0]
+        self.assertTrue(config.prewarm)
+        self.assertEqual(config.enabled_tool_groups, ["incident"])
+        self.assertEqual(config.cache_ttl, 0)
+        self.assertEqual(config.schema_cache_dir, "/tmp/schemas")
+        mock_logging.assert_called_once_with(False)
+        mock_run.assert_called_once_with(mock_server.return_value, host="0.0.0.0", port=9000)
+
+
+class TestRunSseServer(unittest.TestCase):
+    """Test cases for running the SSE server."""
+
+    @patch("servicenow_mcp.server_sse.uvicorn.run")
+    def test_prewarm(self, mock_run):
+        """Test that the server is prewarmed before serving only when configured."""
+        for prewarm in (True, False):
+            server = MagicMock()
+            server.config.prewarm = prewarm
+
+            run_sse_server(server, host="127.0.0.1", port=8080)
+
+            self.assertEqual(server.prewarm.called, prewarm)
+            mock_run.assert_called_with(ANY, host="127.0.0.1", port=8080)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for starting the ServiceNow MCP server and setting up logging.
+"""
+
+import logging
+import os
+import unittest
+from unittest.mock import patch
+
+from servicenow_mcp.server import ServiceNowMCP, configure_logging
+
+
+class TestServerStart(unittest.TestCase):
+    """Test cases for starting the stdio server."""
+
+    @patch("servicenow_mcp.server.importlib.util.find_spec")
+    @patch("servicenow_mcp.server.anyio.run")
+    def test_start_uses_uvloop_when_installed(self, mock_run, mock_find_spec):
+        """Test that the stdio server runs on uvloop only when it is installed."""
+        server = ServiceNowMCP(
+            {
+                "instance_url": "https://example.service-now.com",
+                "auth": {"type": "basic", "basic": {"username": "admin", "password": "password"}},
+                "enabled_tool_groups": [],
+            }
+        )
+
+        for installed in (True, False):
+            mock_find_spec.return_value = object() if installed else None
+            with patch("servicenow_mcp.server.configure_logging"):
+                server.start()
+
+            args, kwargs = mock_run.call_args
+            self.assertEqual(args[0], server.mcp_server.run_stdio_async)
+            self.assertEqual(kwargs["backend_options"], {"use_uvloop": installed})
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Test cases for the default logging setup."""
+
+    def setUp(self):
+        """Start each test with an unconfigured root logger."""
+        self.handlers_patcher = patch.object(logging.getLogger(), "handlers", [])
+        self.handlers_patcher.start()
+
+    def tearDown(self):
+        """Restore the root logger handlers."""
+        self.handlers_patcher.stop()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("servicenow_mcp.server.logging.basicConfig")
+    def test_defaults_to_warning(self, mock_basic_config):
+        """Test that only warnings are logged unless asked otherwise."""
+        configure_logging()
+
+        self.assertEqual(mock_basic_config.call_args.kwargs["level"], "WARNING")
+
+    @patch.dict(os.environ, {"SERVICENOW_MCP_LOG_LEVEL": "info"})
+    @patch("servicenow_mcp.server.logging.basicConfig")
+    def test_level_from_environment(self, mock_basic_config):
+        """Test that the log level can be raised from the environment."""
+        configure_logging()
+        self.assertEqual(mock_basic_config.call_args.kwargs["level"], "INFO")
+
+        mock_basic_config.reset_mock()
+        configure_logging(debug=True)
+        self.assertEqual(mock_basic_config.call_args.kwargs["level"], "DEBUG")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for restricting which tool groups the ServiceNow MCP server registers.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.server import ServiceNowMCP, parse_tool_groups
+
+
+class TestServerToolGroups(unittest.TestCase):
+    """Test cases for tool group selection."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "instance_url": "https://example.service-now.com",
+            "auth": {
+                "type": "basic",
+                "basic": {
+                    "username": "admin",
+                    "password": "password",
+                },
+            },
+        }
+        self.mock_mcp = MagicMock()
+        self.patcher = patch("servicenow_mcp.server.FastMCP", return_value=self.mock_mcp)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.patcher.stop()
+
+    def _registered_tool_names(self):
+        """Return the names of the functions passed to the tool decorator."""
+        decorator = self.mock_mcp.tool.return_value
+        return [call[0][0].__name__ for call in decorator.call_args_list]
+
+    def test_all_groups_registered_by_default(self):
+        """Test that every group is registered when no allow-list is configured."""
+        ServiceNowMCP(self.config)
+
+        names = self._registered_tool_names()
+        self.assertIn("create_incident", names)
+        self.assertIn("list_catalog_items", names)
+        self.assertIn("list_users", names)
+
+    def test_only_enabled_groups_registered(self):
+        """Test that only the configured groups are registered."""
+        ServiceNowMCP({**self.config, "enabled_tool_groups": ["incident"]})
+
+        names = self._registered_tool_names()
+        self.assertIn("create_incident", names)
+        self.assertIn("list_incidents", names)
+        self.assertNotIn("list_catalog_items", names)
+        self.assertNotIn("list_users", names)
+
+    def test_parse_tool_groups(self):
+        """Test parsing a comma-separated list of tool groups."""
+        self.assertEqual(parse_tool_groups("incident, catalog,"), ["incident", "catalog"])
+        self.assertIsNone(parse_tool_groups(""))
+        self.assertIsNone(parse_tool_groups(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
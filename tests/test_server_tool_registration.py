@@ -0,0 +1,75 @@
+"""
+Tests for how the ServiceNow MCP server builds and lists its tools.
+"""
+
+import asyncio
+import gc
+import unittest
+import weakref
+from unittest.mock import patch
+
+from mcp.types import ListToolsRequest
+
+from servicenow_mcp.server import ServiceNowMCP
+
+
+class TestServerToolRegistration(unittest.TestCase):
+    """Test cases for tool schemas and the tool listing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "instance_url": "https://example.service-now.com",
+            "auth": {"type": "basic", "basic": {"username": "admin", "password": "password"}},
+            "enabled_tool_groups": ["incident"],
+        }
+
+    def test_tool_schemas_are_reused_between_servers(self):
+        """Test that a second server does not regenerate tool schemas."""
+        first = ServiceNowMCP(self.config)
+
+        with patch("servicenow_mcp.server.Tool.from_function") as mock_from_function:
+            second = ServiceNowMCP(self.config)
+
+        mock_from_function.assert_not_called()
+        first_tool = first.mcp_server._tool_manager.get_tool("list_incidents")
+        second_tool = second.mcp_server._tool_manager.get_tool("list_incidents")
+        self.assertEqual(first_tool.parameters, second_tool.parameters)
+        self.assertIsNot(first_tool.fn, second_tool.fn)
+
+    def test_tool_templates_do_not_keep_servers_alive(self):
+        """Test that a server can be freed after later servers reuse its tool schemas."""
+        first = ServiceNowMCP(self.config)
+        first_mcp_server = weakref.ref(first.mcp_server)
+        first_auth_manager = weakref.ref(first.auth_manager)
+        second = ServiceNowMCP(self.config)
+
+        del first
+        gc.collect()
+
+        self.assertIsNone(first_mcp_server())
+        self.assertIsNone(first_auth_manager())
+        self.assertIsNotNone(second.mcp_server._tool_manager.get_tool("list_incidents").fn)
+
+    def test_tool_listing_is_built_once(self):
+        """Test that tools/list reuses its response until a tool is added."""
+        server = ServiceNowMCP(self.config)
+        handler = server.mcp_server._mcp_server.request_handlers[ListToolsRequest]
+        request = ListToolsRequest(method="tools/list")
+
+        first = asyncio.run(handler(request)).root.tools
+        second = asyncio.run(handler(request)).root.tools
+
+        self.assertEqual(
+            [tool.name for tool in first],
+            [tool.name for tool in asyncio.run(server.mcp_server.list_tools())],
+        )
+        self.assertIs(first[0], second[0])
+
+        server.mcp_server.add_tool(lambda: "pong", name="ping")
+        third = asyncio.run(handler(request)).root.tools
+        self.assertEqual(len(third), len(first) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,12 +42,12 @@ class TestWorkflowTools(unittest.TestCase):
         )
         self.auth_manager = AuthManager(self.auth_config)
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_workflows_success(self, mock_get):
         """Test listing workflows successfully."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "workflow123",
@@ -64,7 +64,7 @@ class TestWorkflowTools(unittest.TestCase):
                     "table": "change_request",
                 },
             ]
-        }
+        }).encode()
         mock_response.headers = {"X-Total-Count": "2"}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
@@ -83,12 +83,12 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["workflows"][0]["sys_id"], "workflow123")
         self.assertEqual(result["workflows"][1]["sys_id"], "workflow456")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_workflows_empty_result(self, mock_get):
         """Test listing workflows with empty result."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"result": []}
+        mock_response.content = json.dumps({"result": []}).encode()
         mock_response.headers = {"X-Total-Count": "0"}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
@@ -105,7 +105,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["count"], 0)
         self.assertEqual(result["total"], 0)
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_workflows_error(self, mock_get):
         """Test listing workflows with error."""
         # Mock the response
@@ -122,7 +122,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertIn("error", result)
         self.assertEqual(result["error"], "API Error")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_get_workflow_details_success(self, mock_get):
         """Test getting workflow details successfully."""
         # Mock the response
@@ -149,7 +149,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["workflow"]["sys_id"], "workflow123")
         self.assertEqual(result["workflow"]["name"], "Incident Approval")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_get_workflow_details_error(self, mock_get):
         """Test getting workflow details with error."""
         # Mock the response
@@ -165,12 +165,12 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertIn("error", result)
         self.assertEqual(result["error"], "API Error")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_list_workflow_versions_success(self, mock_get):
         """Test listing workflow versions successfully."""
         # Mock the response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "version123",
@@ -187,7 +187,7 @@ class TestWorkflowTools(unittest.TestCase):
                     "published": "true",
                 },
             ]
-        }
+        }).encode()
         mock_response.headers = {"X-Total-Count": "2"}
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
@@ -206,7 +206,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["versions"][0]["sys_id"], "version123")
         self.assertEqual(result["versions"][1]["sys_id"], "version456")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
+    @patch("requests.Session.get")
     def test_get_workflow_activities_success(self, mock_get):
         """Test getting workflow activities successfully."""
         # Mock the responses for version query and activities query
@@ -270,7 +270,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["activities"][0]["sys_id"], "activity123")
         self.assertEqual(result["activities"][1]["sys_id"], "activity456")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.post")
+    @patch("requests.Session.post")
     def test_create_workflow_success(self, mock_post):
         """Test creating a workflow successfully."""
         # Mock the response
@@ -301,7 +301,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["workflow"]["name"], "New Workflow")
         self.assertEqual(result["message"], "Workflow created successfully")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_update_workflow_success(self, mock_patch):
         """Test updating a workflow successfully."""
         # Mock the response
@@ -331,7 +331,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["workflow"]["name"], "Updated Workflow")
         self.assertEqual(result["message"], "Workflow updated successfully")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_activate_workflow_success(self, mock_patch):
         """Test activating a workflow successfully."""
         # Mock the response
@@ -357,7 +357,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["workflow"]["active"], "true")
         self.assertEqual(result["message"], "Workflow activated successfully")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_deactivate_workflow_success(self, mock_patch):
         """Test deactivating a workflow successfully."""
         # Mock the response
@@ -383,8 +383,8 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["workflow"]["active"], "false")
         self.assertEqual(result["message"], "Workflow deactivated successfully")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.get")
-    @patch("servicenow_mcp.tools.workflow_tools.requests.post")
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
     def test_add_workflow_activity_success(self, mock_post, mock_get):
         """Test adding a workflow activity successfully."""
         # Mock the responses for version query and activity creation
@@ -453,7 +453,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["version_id"], "version123")
         self.assertEqual(result["message"], "Activity added successfully")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_update_workflow_activity_success(self, mock_patch):
         """Test updating a workflow activity successfully."""
         # Mock the response
@@ -481,7 +481,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["activity"]["name"], "Updated Activity")
         self.assertEqual(result["message"], "Activity updated successfully")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_workflow_activity_success(self, mock_delete):
         """Test deleting a workflow activity successfully."""
         # Mock the response
@@ -499,7 +499,7 @@ class TestWorkflowTools(unittest.TestCase):
         self.assertEqual(result["message"], "Activity deleted successfully")
         self.assertEqual(result["activity_id"], "activity123")
 
-    @patch("servicenow_mcp.tools.workflow_tools.requests.patch")
+    @patch("requests.Session.patch")
     def test_reorder_workflow_activities_success(self, mock_patch):
         """Test reordering workflow activities successfully."""
         # Mock the response
@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -51,12 +52,14 @@ class TestWorkflowToolsParams(unittest.TestCase):
         with self.assertRaises(ValueError):
             _get_auth_and_config(invalid_obj1, invalid_obj2)
 
-    @patch('servicenow_mcp.tools.workflow_tools.requests.get')
+    @patch('requests.Session.get')
     def test_list_workflows_correct_params(self, mock_get):
         """Test list_workflows with parameters in the correct order."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"result": [{"sys_id": "123", "name": "Test Workflow"}]}
+        mock_response.content = json.dumps(
+            {"result": [{"sys_id": "123", "name": "Test Workflow"}]}
+        ).encode()
         mock_response.headers = {"X-Total-Count": "1"}
         mock_get.return_value = mock_response
         
@@ -68,12 +71,14 @@ class TestWorkflowToolsParams(unittest.TestCase):
         self.assertEqual(result["count"], 1)
         self.assertEqual(result["workflows"][0]["name"], "Test Workflow")
 
-    @patch('servicenow_mcp.tools.workflow_tools.requests.get')
+    @patch('requests.Session.get')
     def test_list_workflows_swapped_params(self, mock_get):
         """Test list_workflows with parameters in the swapped order."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"result": [{"sys_id": "123", "name": "Test Workflow"}]}
+        mock_response.content = json.dumps(
+            {"result": [{"sys_id": "123", "name": "Test Workflow"}]}
+        ).encode()
         mock_response.headers = {"X-Total-Count": "1"}
         mock_get.return_value = mock_response
         
@@ -85,7 +90,7 @@ class TestWorkflowToolsParams(unittest.TestCase):
         self.assertEqual(result["count"], 1)
         self.assertEqual(result["workflows"][0]["name"], "Test Workflow")
 
-    @patch('servicenow_mcp.tools.workflow_tools.requests.get')
+    @patch('requests.Session.get')
     def test_get_workflow_details_correct_params(self, mock_get):
         """Test get_workflow_details with parameters in the correct order."""
         # Setup mock response
@@ -100,7 +105,7 @@ class TestWorkflowToolsParams(unittest.TestCase):
         mock_get.assert_called_once()
         self.assertEqual(result["workflow"]["name"], "Test Workflow")
 
-    @patch('servicenow_mcp.tools.workflow_tools.requests.get')
+    @patch('requests.Session.get')
     def test_get_workflow_details_swapped_params(self, mock_get):
         """Test get_workflow_details with parameters in the swapped order."""
         # Setup mock response
@@ -115,7 +120,7 @@ class TestWorkflowToolsParams(unittest.TestCase):
         mock_get.assert_called_once()
         self.assertEqual(result["workflow"]["name"], "Test Workflow")
 
-    @patch('servicenow_mcp.tools.workflow_tools.requests.post')
+    @patch('requests.Session.post')
     def test_create_workflow_correct_params(self, mock_post):
         """Test create_workflow with parameters in the correct order."""
         # Setup mock response
@@ -135,7 +140,7 @@ class TestWorkflowToolsParams(unittest.TestCase):
         self.assertEqual(result["workflow"]["name"], "New Workflow")
         self.assertEqual(result["message"], "Workflow created successfully")
 
-    @patch('servicenow_mcp.tools.workflow_tools.requests.post')
+    @patch('requests.Session.post')
     def test_create_workflow_swapped_params(self, mock_post):
         """Test create_workflow with parameters in the swapped order."""
         # Setup mock response